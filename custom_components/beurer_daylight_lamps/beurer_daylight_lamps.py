@@ -26,6 +26,8 @@ from __future__ import annotations
 import asyncio
 import datetime
 import time
+from functools import reduce
+from operator import xor
 from typing import TYPE_CHECKING, Any
 
 from bleak import BleakClient  # noqa: TC002 - needed at runtime for test mocking
@@ -33,6 +35,7 @@ from bleak.exc import BleakError
 from bleak_retry_connector import BleakClientWithServiceCache, establish_connection
 from homeassistant.components import bluetooth
 from homeassistant.components.light import ColorMode  # type: ignore[attr-defined]
+from homeassistant.helpers.device_registry import format_mac
 
 from .therapy import SunriseSimulation, TherapyTracker
 from .wl90 import WL90Controller
@@ -44,6 +47,8 @@ if TYPE_CHECKING:
     from bleak.backends.device import BLEDevice
     from homeassistant.core import HomeAssistant
 
+    from .switch import BeurerAdaptiveLightingSwitch
+
 from .const import (
     # Adapter failure constants
     ADAPTER_FAILURE_COOLDOWN,
@@ -96,6 +101,13 @@ from .const import (
     is_wl_model,
 )
 
+# Effect name -> protocol index, for effect commands. Status notifications
+# decode the index with SUPPORTED_EFFECTS too, so both directions share one
+# effect order
+_EFFECT_INDEX: dict[str, int] = {
+    effect: index for index, effect in enumerate(SUPPORTED_EFFECTS)
+}
+
 
 class BeurerInstance:
     """Representation of a Beurer daylight lamp BLE device."""
@@ -119,10 +131,13 @@ class BeurerInstance:
             raise ValueError(f"Invalid device object: {device}")
 
         self._mac: str = device.address
+        # Normalized once here; every entity derives its IDs from it
+        self._formatted_mac: str = format_mac(device.address)
         self._ble_device: BLEDevice = device
         self._hass: HomeAssistant | None = hass
         self._client: BleakClient | None = None
-        self._update_callbacks: list[Callable[[], None]] = []
+        # Insertion-ordered set of callbacks (dict keys)
+        self._update_callbacks: dict[Callable[[], None], None] = {}
         self._rssi: int | None = rssi
 
         # Light state
@@ -167,7 +182,9 @@ class BeurerInstance:
         # Therapy tracking and WL90
         self._sunrise_simulation: SunriseSimulation | None = None
         self._therapy_tracker: TherapyTracker = TherapyTracker()
-        self.adaptive_lighting_switch: Any = None
+        self.adaptive_lighting_switch: BeurerAdaptiveLightingSwitch | None = None
+        # Therapy mode blocks Adaptive Lighting from overriding the light
+        self._therapy_active: bool = False
         self._is_wl: bool = is_wl_model(getattr(device, "name", None))
         self._wl90: WL90Controller | None = (
             WL90Controller(self) if self._is_wl else None
@@ -691,19 +708,22 @@ class BeurerInstance:
         """Register or unregister a callback for state updates."""
         if callback is None:
             return
-        if callback not in self._update_callbacks:
-            self._update_callbacks.append(callback)
+        self._update_callbacks.setdefault(callback)
 
     def remove_update_callback(self, callback: Callable[[], None]) -> None:
         """Remove a callback from state updates."""
-        if callback in self._update_callbacks:
-            self._update_callbacks.remove(callback)
+        self._update_callbacks.pop(callback, None)
 
     @property
     def mac(self) -> str:
         """Return the MAC address."""
         return self._mac
 
+    @property
+    def formatted_mac(self) -> str:
+        """Return the MAC address normalized for device and entity IDs."""
+        return self._formatted_mac
+
     @property
     def is_on(self) -> bool | None:
         """Return True if lamp is on, None if unknown/unavailable.
@@ -817,20 +837,16 @@ class BeurerInstance:
         """Find the index of an effect."""
         if effect is None:
             return 0
-        try:
-            return self._supported_effects.index(effect)
-        except ValueError:
+        if (index := _EFFECT_INDEX.get(effect)) is None:
             LOGGER.debug(
                 "Effect '%s' not in supported list, defaulting to 'Off'", effect
             )
             return 0
+        return index
 
     def _calculate_checksum(self, length: int, data: list[int]) -> int:
-        """Calculate packet checksum."""
-        result = length
-        for byte in data:
-            result ^= byte
-        return result
+        """Calculate packet checksum (XOR of length and all data bytes)."""
+        return reduce(xor, data, length)
 
     async def _write(self, data: bytearray) -> bool:
         """Write data to the device.
@@ -915,9 +931,7 @@ class BeurerInstance:
         plen = length + 2  # payload_len includes command bytes + checksum
 
         # Calculate checksum: plen XOR all command bytes
-        checksum = plen
-        for byte in message:
-            checksum ^= byte
+        checksum = self._calculate_checksum(plen, message)
 
         # Packet format from btsnoop analysis:
         # - Header: FE EF 0A
@@ -1457,7 +1471,8 @@ class BeurerInstance:
         """Trigger Home Assistant state update."""
         if self._update_callbacks:
             LOGGER.debug("Triggering HA update for %s", self._mac)
-            for callback in self._update_callbacks:
+            # Snapshot so callbacks may unregister themselves
+            for callback in tuple(self._update_callbacks):
                 callback()
 
     def _handle_white_status(self, data: bytearray) -> bool:
@@ -1513,8 +1528,8 @@ class BeurerInstance:
 
         if new_color_on:
             effect_idx = data[16]
-            if effect_idx < len(self._supported_effects):
-                new_effect = self._supported_effects[effect_idx]
+            if effect_idx < len(SUPPORTED_EFFECTS):
+                new_effect = SUPPORTED_EFFECTS[effect_idx]
             new_color_brightness = int(data[10] * 255 / 100)
             new_rgb = (data[13], data[14], data[15])
 
@@ -9,16 +9,11 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
-from homeassistant.helpers.device_registry import (
-    CONNECTION_BLUETOOTH,
-    DeviceInfo,
-    format_mac,
-)
 from homeassistant.helpers.entity import EntityCategory  # type: ignore[attr-defined]
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, VERSION, detect_model
 from .coordinator import BeurerDataUpdateCoordinator
+from .entity import build_device_info
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -92,7 +87,8 @@ class BeurerBinarySensor(
         self._instance = coordinator.instance
         self._device_name = device_name
         self.entity_description = description
-        self._attr_unique_id = f"{format_mac(self._instance.mac)}_{description.key}"
+        self._attr_unique_id = f"{self._instance.formatted_mac}_{description.key}"
+        self._attr_device_info = build_device_info(self._instance, self._device_name)
 
     @property
     def is_on(self) -> bool | None:
@@ -111,19 +107,6 @@ class BeurerBinarySensor(
         """
         return True
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        mac = format_mac(self._instance.mac)
-        return DeviceInfo(
-            identifiers={(DOMAIN, mac)},
-            name=self._device_name,
-            manufacturer="Beurer",
-            model=detect_model(self._device_name),
-            sw_version=VERSION,
-            connections={(CONNECTION_BLUETOOTH, mac)},
-        )
-
 
 class BeurerTherapyBinarySensor(
     CoordinatorEntity[BeurerDataUpdateCoordinator], BinarySensorEntity
@@ -147,7 +130,8 @@ class BeurerTherapyBinarySensor(
         self._instance = coordinator.instance
         self._device_name = device_name
         self.entity_description = description
-        self._attr_unique_id = f"{format_mac(self._instance.mac)}_{description.key}"
+        self._attr_unique_id = f"{self._instance.formatted_mac}_{description.key}"
+        self._attr_device_info = build_device_info(self._instance, self._device_name)
 
     @property
     def is_on(self) -> bool | None:
@@ -160,16 +144,3 @@ class BeurerTherapyBinarySensor(
     def available(self) -> bool:
         """Return True if entity is available."""
         return True  # Always available as tracking persists
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        mac = format_mac(self._instance.mac)
-        return DeviceInfo(
-            identifiers={(DOMAIN, mac)},
-            name=self._device_name,
-            manufacturer="Beurer",
-            model=detect_model(self._device_name),
-            sw_version=VERSION,
-            connections={(CONNECTION_BLUETOOTH, mac)},
-        )
@@ -6,16 +6,13 @@ import asyncio
 from typing import TYPE_CHECKING
 
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
-from homeassistant.helpers.device_registry import (
-    CONNECTION_BLUETOOTH,
-    DeviceInfo,
-    format_mac,
-)
+from homeassistant.core import callback
 from homeassistant.helpers.entity import EntityCategory  # type: ignore[attr-defined]
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, LOGGER, VERSION, detect_model
+from .const import LOGGER
 from .coordinator import BeurerDataUpdateCoordinator
+from .entity import build_device_info
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -75,28 +72,23 @@ class BeurerButton(CoordinatorEntity[BeurerDataUpdateCoordinator], ButtonEntity)
         self._instance = coordinator.instance
         self._device_name = device_name
         self.entity_description = description
-        self._attr_unique_id = f"{format_mac(self._instance.mac)}_{description.key}"
+        self._attr_unique_id = f"{self._instance.formatted_mac}_{description.key}"
+        self._attr_device_info = build_device_info(self._instance, self._device_name)
+        self._attr_available = self._instance.available
 
     @property
     def available(self) -> bool:
-        """Return True if entity is available."""
+        """Return True if the coordinator and the lamp are both available."""
         # Reconnect button should always be available
         if self.entity_description.key == "reconnect":
             return True
-        return self._instance.available
+        return super().available and self._attr_available
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        mac = format_mac(self._instance.mac)
-        return DeviceInfo(
-            identifiers={(DOMAIN, mac)},
-            name=self._device_name,
-            manufacturer="Beurer",
-            model=detect_model(self._device_name),
-            sw_version=VERSION,
-            connections={(CONNECTION_BLUETOOTH, mac)},
-        )
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached availability and write state."""
+        self._attr_available = self._instance.available
+        super()._handle_coordinator_update()
 
     async def async_press(self) -> None:
         """Handle the button press."""
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import Final
 
 DOMAIN: Final = "beurer_daylight_lamps"
@@ -198,9 +199,12 @@ ALARM_TONES: Final[list[str]] = [
 ]
 
 
+@lru_cache(maxsize=64)
 def detect_model(name: str | None) -> str:
     """Detect model from device name.
 
+    Cached because every entity's device info asks for the same few names.
+
     Args:
         name: Device name to check
 
@@ -27,6 +27,8 @@ from .const import (
 )
 
 if TYPE_CHECKING:
+    import asyncio
+
     from .beurer_daylight_lamps import BeurerInstance
 
 
@@ -76,6 +78,9 @@ class BeurerDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # The background task in __init__.py handles the initial connection.
         self._first_refresh: bool = True
 
+        # Pending flush for coalescing bursts of BLE notifications
+        self._push_update_handle: asyncio.Handle | None = None
+
         # Register for push updates from BLE notifications
         self.instance.set_update_callback(self._handle_push_update)
 
@@ -83,9 +88,18 @@ class BeurerDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def _handle_push_update(self) -> None:
         """Handle push update from BLE notification.
 
-        This is called when the device sends a BLE notification.
-        We update the coordinator data and notify all listeners.
+        This is called when the device sends a BLE notification. Notifications
+        tend to arrive in bursts, so the first one schedules a flush on the
+        event loop and the rest are absorbed; the flush reads the latest
+        instance state anyway.
         """
+        if self._push_update_handle is None:
+            self._push_update_handle = self.hass.loop.call_soon(self._flush_push_update)
+
+    @callback
+    def _flush_push_update(self) -> None:
+        """Update the coordinator data and notify all listeners."""
+        self._push_update_handle = None
         LOGGER.debug("Push update received from %s", self.instance.mac)
         self.async_set_updated_data(self._get_current_data())
         # Adjust polling interval based on new state
@@ -280,6 +294,9 @@ class BeurerDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Called when the config entry is unloaded.
         """
         self.instance.remove_update_callback(self._handle_push_update)
+        if self._push_update_handle is not None:
+            self._push_update_handle.cancel()
+            self._push_update_handle = None
         await super().async_shutdown()
 
     # Convenience properties for entity access
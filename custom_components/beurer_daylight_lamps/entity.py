@@ -0,0 +1,28 @@
+"""Shared entity helpers for Beurer Daylight Lamps."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.helpers.device_registry import (
+    CONNECTION_BLUETOOTH,
+    DeviceInfo,
+)
+
+from .const import DOMAIN, VERSION, detect_model
+
+if TYPE_CHECKING:
+    from .beurer_daylight_lamps import BeurerInstance
+
+
+def build_device_info(instance: BeurerInstance, name: str) -> DeviceInfo:
+    """Return the device registry info shared by all entities of a lamp."""
+    mac = instance.formatted_mac
+    return DeviceInfo(
+        identifiers={(DOMAIN, mac)},
+        name=name,
+        manufacturer="Beurer",
+        model=detect_model(name),
+        sw_version=VERSION,
+        connections={(CONNECTION_BLUETOOTH, mac)},
+    )
@@ -14,11 +14,7 @@ from homeassistant.components.light import (  # type: ignore[attr-defined]
     LightEntity,
     LightEntityFeature,
 )
-from homeassistant.helpers.device_registry import (
-    CONNECTION_BLUETOOTH,
-    DeviceInfo,
-    format_mac,
-)
+from homeassistant.core import callback
 from homeassistant.helpers.restore_state import ExtraStoredData, RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util.color import (
@@ -26,8 +22,9 @@ from homeassistant.util.color import (
     match_max_scale,
 )
 
-from .const import DOMAIN, LOGGER, VERSION, detect_model
+from .const import LOGGER
 from .coordinator import BeurerDataUpdateCoordinator
+from .entity import build_device_info
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -119,8 +116,11 @@ class BeurerLight(
         self._instance = coordinator.instance
         self._entry_id = entry_id
         self._device_name = name
-        self._attr_unique_id = format_mac(self._instance.mac)
+        self._attr_unique_id = self._instance.formatted_mac
+        self._attr_device_info = build_device_info(self._instance, self._device_name)
         self._color_temp_kelvin: int | None = None  # Track color temperature
+        self._attr_effect_list = self._instance.supported_effects
+        self._update_attrs()
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -139,6 +139,7 @@ class BeurerLight(
                 self._color_temp_kelvin,
                 self._instance.mac,
             )
+            self._update_attrs()
 
         await self._instance.update()
 
@@ -151,84 +152,56 @@ class BeurerLight(
     def available(self) -> bool:
         """Return True if entity is available.
 
-        Stays available after first successful connection so commands
-        can trigger reconnection transparently via _send_packet.
+        CoordinatorEntity only reports the coordinator's update status, so
+        combine it with the cached device availability.
         """
-        return self._instance.available
-
-    @property
-    def assumed_state(self) -> bool:
-        """Return True when not connected (state may be stale)."""
-        return not self._instance.is_connected
-
-    @property
-    def should_poll(self) -> bool:
-        """Return False, updates via BLE notifications."""
-        return False
-
-    @property
-    def brightness(self) -> int | None:
-        """Return the brightness of the light (0-255)."""
-        if self._instance.color_mode == ColorMode.WHITE:
-            return self._instance.white_brightness
-        return self._instance.color_brightness
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if light is on."""
-        return self._instance.is_on
-
-    @property
-    def rgb_color(self) -> tuple[int, int, int] | None:
-        """Return the RGB color value."""
-        # Only return RGB when in color mode
-        if self._instance.color_mode != ColorMode.RGB:
-            return None
-        scaled = match_max_scale((255,), self._instance.rgb_color)
-        return (scaled[0], scaled[1], scaled[2])
+        return super().available and self._attr_available
 
-    @property
-    def color_temp_kelvin(self) -> int | None:
-        """Return the color temperature in Kelvin."""
-        if self._instance.color_mode == ColorMode.COLOR_TEMP:
-            return self._color_temp_kelvin
-        return None
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached state attributes and write state."""
+        self._update_attrs()
+        super()._handle_coordinator_update()
 
-    @property
-    def effect(self) -> str | None:
-        """Return the current effect."""
-        if self._instance.color_mode == ColorMode.WHITE:
-            return None
-        return self._instance.effect
+    @callback
+    def _update_attrs(self) -> None:
+        """Copy current device state into the entity's _attr_* fields.
 
-    @property
-    def effect_list(self) -> list[str]:
-        """Return the list of supported effects."""
-        return self._instance.supported_effects
+        Computed once per coordinator update instead of on every property
+        read during state writes.
+        """
+        instance = self._instance
+        mode = instance.color_mode
+
+        # Stays available after first successful connection so commands
+        # can trigger reconnection transparently via _send_packet.
+        self._attr_available = instance.available
+        # State may be stale when not connected
+        self._attr_assumed_state = not instance.is_connected
+        self._attr_is_on = instance.is_on
+
+        if mode == ColorMode.WHITE:
+            # Native white mode: no RGB/effect, white brightness
+            self._attr_brightness = instance.white_brightness
+            self._attr_color_mode = ColorMode.WHITE
+            self._attr_effect = None
+        else:
+            self._attr_brightness = instance.color_brightness
+            # A color temperature we set (simulated via RGB) wins over RGB
+            self._attr_color_mode = (
+                ColorMode.COLOR_TEMP if self._color_temp_kelvin is not None else mode
+            )
+            self._attr_effect = instance.effect
 
-    @property
-    def color_mode(self) -> ColorMode:
-        """Return the color mode of the light."""
-        # If native white mode is active, report WHITE
-        if self._instance.color_mode == ColorMode.WHITE:
-            return ColorMode.WHITE
-        # If we set a color temperature (simulated via RGB), report COLOR_TEMP
-        if self._color_temp_kelvin is not None:
-            return ColorMode.COLOR_TEMP
-        # Otherwise report the instance's mode (RGB)
-        return self._instance.color_mode
+        # Only report RGB when in color mode
+        if mode == ColorMode.RGB:
+            scaled = match_max_scale((255,), instance.rgb_color)
+            self._attr_rgb_color = (scaled[0], scaled[1], scaled[2])
+        else:
+            self._attr_rgb_color = None
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info for device registry."""
-        mac = format_mac(self._instance.mac)
-        return DeviceInfo(
-            identifiers={(DOMAIN, mac)},
-            name=self._device_name,
-            manufacturer="Beurer",
-            model=detect_model(self._device_name),
-            sw_version=VERSION,
-            connections={(CONNECTION_BLUETOOTH, mac)},
+        self._attr_color_temp_kelvin = (
+            self._color_temp_kelvin if mode == ColorMode.COLOR_TEMP else None
         )
 
     async def _handle_color_temp(
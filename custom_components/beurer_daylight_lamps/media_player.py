@@ -18,15 +18,11 @@ from homeassistant.components.media_player import (  # type: ignore[attr-defined
     MediaPlayerState,
     MediaType,
 )
-from homeassistant.helpers.device_registry import (
-    CONNECTION_BLUETOOTH,
-    DeviceInfo,
-    format_mac,
-)
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, VERSION, detect_model
 from .coordinator import BeurerDataUpdateCoordinator
+from .entity import build_device_info
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -82,7 +78,9 @@ class BeurerRadioPlayer(
         super().__init__(coordinator)
         self._instance = coordinator.instance
         self._device_name = device_name
-        self._attr_unique_id = f"{format_mac(self._instance.mac)}_radio"
+        self._attr_unique_id = f"{self._instance.formatted_mac}_radio"
+        self._attr_device_info = build_device_info(self._instance, self._device_name)
+        self._attr_available = self._instance.available
 
     @property
     def state(self) -> MediaPlayerState:
@@ -130,21 +128,14 @@ class BeurerRadioPlayer(
 
     @property
     def available(self) -> bool:
-        """Return True if entity is available."""
-        return self._instance.available
+        """Return True if the coordinator and the lamp are both available."""
+        return super().available and self._attr_available
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        mac = format_mac(self._instance.mac)
-        return DeviceInfo(
-            identifiers={(DOMAIN, mac)},
-            name=self._device_name,
-            manufacturer="Beurer",
-            model=detect_model(self._device_name),
-            sw_version=VERSION,
-            connections={(CONNECTION_BLUETOOTH, mac)},
-        )
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached availability and write state."""
+        self._attr_available = self._instance.available
+        super()._handle_coordinator_update()
 
     async def async_turn_on(self) -> None:
         """Turn on the radio."""
@@ -215,7 +206,9 @@ class BeurerMusicPlayer(
         super().__init__(coordinator)
         self._instance = coordinator.instance
         self._device_name = device_name
-        self._attr_unique_id = f"{format_mac(self._instance.mac)}_music"
+        self._attr_unique_id = f"{self._instance.formatted_mac}_music"
+        self._attr_device_info = build_device_info(self._instance, self._device_name)
+        self._attr_available = self._instance.available
 
     @property
     def state(self) -> MediaPlayerState:
@@ -248,21 +241,14 @@ class BeurerMusicPlayer(
 
     @property
     def available(self) -> bool:
-        """Return True if entity is available."""
-        return self._instance.available
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        mac = format_mac(self._instance.mac)
-        return DeviceInfo(
-            identifiers={(DOMAIN, mac)},
-            name=self._device_name,
-            manufacturer="Beurer",
-            model=detect_model(self._device_name),
-            sw_version=VERSION,
-            connections={(CONNECTION_BLUETOOTH, mac)},
-        )
+        """Return True if the coordinator and the lamp are both available."""
+        return super().available and self._attr_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached availability and write state."""
+        self._attr_available = self._instance.available
+        super()._handle_coordinator_update()
 
     async def async_turn_on(self) -> None:
         """Turn on the speaker."""
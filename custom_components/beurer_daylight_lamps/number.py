@@ -11,16 +11,13 @@ from homeassistant.components.number import (
     NumberMode,
 )
 from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfTime
+from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers.device_registry import (
-    CONNECTION_BLUETOOTH,
-    DeviceInfo,
-    format_mac,
-)
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, LOGGER, VERSION, detect_model
+from .const import LOGGER
 from .coordinator import BeurerDataUpdateCoordinator
+from .entity import build_device_info
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -118,7 +115,9 @@ class BeurerBrightnessNumber(
         self._instance = coordinator.instance
         self._device_name = device_name
         self.entity_description = description
-        self._attr_unique_id = f"{format_mac(self._instance.mac)}_{description.key}"
+        self._attr_unique_id = f"{self._instance.formatted_mac}_{description.key}"
+        self._attr_device_info = build_device_info(self._instance, self._device_name)
+        self._attr_available = self._instance.available
 
     @property
     def native_value(self) -> float | None:
@@ -135,21 +134,14 @@ class BeurerBrightnessNumber(
 
     @property
     def available(self) -> bool:
-        """Return True if entity is available."""
-        return self._instance.available
+        """Return True if the coordinator and the lamp are both available."""
+        return super().available and self._attr_available
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        mac = format_mac(self._instance.mac)
-        return DeviceInfo(
-            identifiers={(DOMAIN, mac)},
-            name=self._device_name,
-            manufacturer="Beurer",
-            model=detect_model(self._device_name),
-            sw_version=VERSION,
-            connections={(CONNECTION_BLUETOOTH, mac)},
-        )
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached availability and write state."""
+        self._attr_available = self._instance.available
+        super()._handle_coordinator_update()
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the brightness value."""
@@ -194,7 +186,9 @@ class BeurerTimerNumber(CoordinatorEntity[BeurerDataUpdateCoordinator], NumberEn
         super().__init__(coordinator)
         self._instance = coordinator.instance
         self._device_name = device_name
-        self._attr_unique_id = f"{format_mac(self._instance.mac)}_timer"
+        self._attr_unique_id = f"{self._instance.formatted_mac}_timer"
+        self._attr_device_info = build_device_info(self._instance, self._device_name)
+        self._attr_available = self._instance.available
 
     @property
     def native_value(self) -> float | None:
@@ -205,21 +199,14 @@ class BeurerTimerNumber(CoordinatorEntity[BeurerDataUpdateCoordinator], NumberEn
 
     @property
     def available(self) -> bool:
-        """Return True when device is available."""
-        return self._instance.available
+        """Return True if the coordinator and the lamp are both available."""
+        return super().available and self._attr_available
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        mac = format_mac(self._instance.mac)
-        return DeviceInfo(
-            identifiers={(DOMAIN, mac)},
-            name=self._device_name,
-            manufacturer="Beurer",
-            model=detect_model(self._device_name),
-            sw_version=VERSION,
-            connections={(CONNECTION_BLUETOOTH, mac)},
-        )
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached availability and write state."""
+        self._attr_available = self._instance.available
+        super()._handle_coordinator_update()
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the timer value in minutes.
@@ -289,7 +276,8 @@ class BeurerTherapyGoalNumber(
         super().__init__(coordinator)
         self._instance = coordinator.instance
         self._device_name = device_name
-        self._attr_unique_id = f"{format_mac(self._instance.mac)}_therapy_goal"
+        self._attr_unique_id = f"{self._instance.formatted_mac}_therapy_goal"
+        self._attr_device_info = build_device_info(self._instance, self._device_name)
 
     @property
     def native_value(self) -> float | None:
@@ -301,19 +289,6 @@ class BeurerTherapyGoalNumber(
         """Return True if entity is available."""
         return True  # Always available as it's a configuration
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        mac = format_mac(self._instance.mac)
-        return DeviceInfo(
-            identifiers={(DOMAIN, mac)},
-            name=self._device_name,
-            manufacturer="Beurer",
-            model=detect_model(self._device_name),
-            sw_version=VERSION,
-            connections={(CONNECTION_BLUETOOTH, mac)},
-        )
-
     async def async_set_native_value(self, value: float) -> None:
         """Set the daily therapy goal in minutes."""
         minutes = int(value)
@@ -342,7 +317,9 @@ class BeurerWL90Number(CoordinatorEntity[BeurerDataUpdateCoordinator], NumberEnt
         self._instance = coordinator.instance
         self._device_name = device_name
         self.entity_description = description
-        self._attr_unique_id = f"{format_mac(self._instance.mac)}_{description.key}"
+        self._attr_unique_id = f"{self._instance.formatted_mac}_{description.key}"
+        self._attr_device_info = build_device_info(self._instance, self._device_name)
+        self._attr_available = self._instance.available
 
     @property
     def native_value(self) -> float | None:
@@ -358,21 +335,14 @@ class BeurerWL90Number(CoordinatorEntity[BeurerDataUpdateCoordinator], NumberEnt
 
     @property
     def available(self) -> bool:
-        """Return True if entity is available."""
-        return self._instance.available
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        mac = format_mac(self._instance.mac)
-        return DeviceInfo(
-            identifiers={(DOMAIN, mac)},
-            name=self._device_name,
-            manufacturer="Beurer",
-            model=detect_model(self._device_name),
-            sw_version=VERSION,
-            connections={(CONNECTION_BLUETOOTH, mac)},
-        )
+        """Return True if the coordinator and the lamp are both available."""
+        return super().available and self._attr_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached availability and write state."""
+        self._attr_available = self._instance.available
+        super()._handle_coordinator_update()
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the volume value."""
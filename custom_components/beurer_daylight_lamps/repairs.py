@@ -151,6 +151,15 @@ class InitializationFailedRepairFlow(RepairsFlow):
         )
 
 
+# Issue ID prefix -> repair flow (issue IDs are formatted as {prefix}{entry_id})
+_REPAIR_FLOWS: dict[
+    str, type[DeviceNotFoundRepairFlow | InitializationFailedRepairFlow]
+] = {
+    "device_not_found_": DeviceNotFoundRepairFlow,
+    "initialization_failed_": InitializationFailedRepairFlow,
+}
+
+
 async def async_create_fix_flow(
     hass: HomeAssistant,
     issue_id: str,
@@ -159,13 +168,23 @@ async def async_create_fix_flow(
     """Create flow for fixing an issue.
 
     This is called by Home Assistant when user clicks "Fix" on an issue.
+    Issues whose config entry no longer exists are rejected here instead
+    of presenting a flow that can only abort.
     """
     LOGGER.debug("Creating repair flow for issue: %s", issue_id)
 
-    if issue_id.startswith("device_not_found_"):
-        return DeviceNotFoundRepairFlow(issue_id, data or {})
-    if issue_id.startswith("initialization_failed_"):
-        return InitializationFailedRepairFlow(issue_id, data or {})
+    for prefix, flow_class in _REPAIR_FLOWS.items():
+        if not issue_id.startswith(prefix):
+            continue
+        entry_id = issue_id.removeprefix(prefix)
+        if hass.config_entries.async_get_entry(entry_id) is None:
+            LOGGER.warning(
+                "Cannot repair issue %s: config entry %s no longer exists",
+                issue_id,
+                entry_id,
+            )
+            raise ValueError(f"Config entry not found for issue: {issue_id}")
+        return flow_class(issue_id, data or {})
 
     # Fallback - shouldn't happen
     raise ValueError(f"Unknown issue type: {issue_id}")
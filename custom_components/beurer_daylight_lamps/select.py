@@ -5,15 +5,12 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
-from homeassistant.helpers.device_registry import (
-    CONNECTION_BLUETOOTH,
-    DeviceInfo,
-    format_mac,
-)
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, LOGGER, SUPPORTED_EFFECTS, VERSION, detect_model
+from .const import LOGGER, SUPPORTED_EFFECTS
 from .coordinator import BeurerDataUpdateCoordinator
+from .entity import build_device_info
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -47,6 +44,8 @@ class BeurerEffectSelect(CoordinatorEntity[BeurerDataUpdateCoordinator], SelectE
     """Representation of a Beurer effect select."""
 
     _attr_has_entity_name = True
+    # Effects are fixed by the firmware, so every lamp shares one list
+    _attr_options = list(SUPPORTED_EFFECTS)
 
     def __init__(
         self,
@@ -59,31 +58,25 @@ class BeurerEffectSelect(CoordinatorEntity[BeurerDataUpdateCoordinator], SelectE
         self._instance = coordinator.instance
         self._device_name = device_name
         self.entity_description = description
-        self._attr_unique_id = f"{format_mac(self._instance.mac)}_{description.key}"
-        self._attr_options = list(SUPPORTED_EFFECTS)
-
-    @property
-    def current_option(self) -> str | None:
-        """Return current selected effect."""
-        return self._instance.effect
+        self._attr_unique_id = f"{self._instance.formatted_mac}_{description.key}"
+        self._attr_device_info = build_device_info(self._instance, device_name)
+        self._attr_available = self._instance.available
 
     @property
     def available(self) -> bool:
-        """Return True if entity is available."""
-        return self._instance.available
+        """Return True if the coordinator and the lamp are both available."""
+        return super().available and self._attr_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached availability and write state."""
+        self._attr_available = self._instance.available
+        super()._handle_coordinator_update()
 
     @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        mac = format_mac(self._instance.mac)
-        return DeviceInfo(
-            identifiers={(DOMAIN, mac)},
-            name=self._device_name,
-            manufacturer="Beurer",
-            model=detect_model(self._device_name),
-            sw_version=VERSION,
-            connections={(CONNECTION_BLUETOOTH, mac)},
-        )
+    def current_option(self) -> str | None:
+        """Return current selected effect."""
+        return self._instance.effect
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected effect."""
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from itertools import chain
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -15,25 +17,44 @@ from homeassistant.const import (
     SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
     UnitOfTime,
 )
-from homeassistant.helpers.device_registry import (
-    CONNECTION_BLUETOOTH,
-    DeviceInfo,
-    format_mac,
-)
+from homeassistant.core import callback
 from homeassistant.helpers.entity import EntityCategory  # type: ignore[attr-defined]
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, VERSION, detect_model
 from .coordinator import BeurerDataUpdateCoordinator
+from .entity import build_device_info
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
+    from homeassistant.helpers.typing import StateType
 
+    from .beurer_daylight_lamps import BeurerInstance
     from .data import BeurerConfigEntry
 
-SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
-    SensorEntityDescription(
+
+def _instance_available(instance: BeurerInstance) -> bool:
+    """Follow the connection state of the lamp (not its power state)."""
+    return instance.available
+
+
+@dataclass(frozen=True, kw_only=True)
+class BeurerSensorEntityDescription(SensorEntityDescription):
+    """Sensor entity description with bound value/availability getters."""
+
+    value_fn: Callable[[BeurerInstance], StateType]
+    # None: tracked metric, available even while disconnected and regardless
+    # of the coordinator's update status
+    available_fn: Callable[[BeurerInstance], bool] | None = _instance_available
+    attributes_fn: Callable[[BeurerInstance], dict[str, Any]] | None = None
+    # Skip state writes while the value moves less than this (noisy sources)
+    min_change: float | None = None
+
+
+SENSOR_DESCRIPTIONS: tuple[BeurerSensorEntityDescription, ...] = (
+    BeurerSensorEntityDescription(
         key="rssi",
         translation_key="rssi",
         device_class=SensorDeviceClass.SIGNAL_STRENGTH,
@@ -41,52 +62,63 @@ SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
         native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        value_fn=lambda instance: instance.rssi,
+        min_change=2,
     ),
-    SensorEntityDescription(
+    BeurerSensorEntityDescription(
         key="last_notification",
         translation_key="last_notification",
         icon="mdi:bluetooth-transfer",
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=True,
+        value_fn=lambda instance: instance.last_raw_notification,
     ),
 )
 
 # Therapy tracking sensors (lifestyle/wellness feature, NOT medical)
-THERAPY_SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
-    SensorEntityDescription(
+THERAPY_SENSOR_DESCRIPTIONS: tuple[BeurerSensorEntityDescription, ...] = (
+    BeurerSensorEntityDescription(
         key="therapy_today",
         translation_key="therapy_today",
         icon="mdi:sun-clock",
         state_class=SensorStateClass.TOTAL_INCREASING,
         native_unit_of_measurement=UnitOfTime.MINUTES,
+        value_fn=lambda instance: round(instance.therapy_today_minutes, 1),
+        available_fn=None,
     ),
-    SensorEntityDescription(
+    BeurerSensorEntityDescription(
         key="therapy_week",
         translation_key="therapy_week",
         icon="mdi:calendar-week",
         state_class=SensorStateClass.TOTAL,
         native_unit_of_measurement=UnitOfTime.MINUTES,
+        value_fn=lambda instance: round(instance.therapy_week_minutes, 1),
+        available_fn=None,
     ),
-    SensorEntityDescription(
+    BeurerSensorEntityDescription(
         key="therapy_progress",
         translation_key="therapy_progress",
         icon="mdi:progress-check",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
+        value_fn=lambda instance: instance.therapy_goal_progress_pct,
+        available_fn=None,
     ),
 )
 
 # Connection health sensors (diagnostic)
-CONNECTION_HEALTH_SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
-    SensorEntityDescription(
+CONNECTION_HEALTH_SENSOR_DESCRIPTIONS: tuple[BeurerSensorEntityDescription, ...] = (
+    BeurerSensorEntityDescription(
         key="reconnect_count",
         translation_key="reconnect_count",
         icon="mdi:connection",
         state_class=SensorStateClass.TOTAL_INCREASING,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        value_fn=lambda instance: instance.reconnect_count,
+        available_fn=None,
     ),
-    SensorEntityDescription(
+    BeurerSensorEntityDescription(
         key="command_success_rate",
         translation_key="command_success_rate",
         icon="mdi:check-network",
@@ -94,8 +126,11 @@ CONNECTION_HEALTH_SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        value_fn=lambda instance: instance.command_success_rate,
+        available_fn=None,
+        attributes_fn=lambda instance: {"total_commands": instance.total_commands},
     ),
-    SensorEntityDescription(
+    BeurerSensorEntityDescription(
         key="connection_uptime",
         translation_key="connection_uptime",
         icon="mdi:timer-outline",
@@ -103,6 +138,8 @@ CONNECTION_HEALTH_SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfTime.SECONDS,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        value_fn=lambda instance: instance.connection_uptime_seconds,
+        available_fn=None,
     ),
 )
 
@@ -116,196 +153,113 @@ async def async_setup_entry(
     coordinator = entry.runtime_data.coordinator
     name = entry.data.get("name", "Beurer Lamp")
 
-    entities: list[SensorEntity] = [
+    # Diagnostic, therapy tracking and connection health sensors in one batch
+    async_add_entities(
         BeurerSensor(coordinator, name, description)
-        for description in SENSOR_DESCRIPTIONS
-    ]
-    # Add therapy tracking sensors
-    entities.extend(
-        [
-            BeurerTherapySensor(coordinator, name, description)
-            for description in THERAPY_SENSOR_DESCRIPTIONS
-        ]
-    )
-    # Add connection health sensors
-    entities.extend(
-        [
-            BeurerConnectionHealthSensor(coordinator, name, description)
-            for description in CONNECTION_HEALTH_SENSOR_DESCRIPTIONS
-        ]
+        for description in chain(
+            SENSOR_DESCRIPTIONS,
+            THERAPY_SENSOR_DESCRIPTIONS,
+            CONNECTION_HEALTH_SENSOR_DESCRIPTIONS,
+        )
     )
-    async_add_entities(entities)
 
 
 class BeurerSensor(CoordinatorEntity[BeurerDataUpdateCoordinator], SensorEntity):
-    """Representation of a Beurer sensor."""
+    """Representation of a Beurer sensor.
+
+    Covers the diagnostic, therapy tracking and connection health sensors;
+    each description supplies the value, availability and attribute getters.
 
+    NOTE: Therapy tracking is a lifestyle/wellness feature for personal
+    tracking. It is NOT a medical device and should not be used for medical
+    purposes.
+    """
+
+    entity_description: BeurerSensorEntityDescription
     _attr_has_entity_name = True
 
     # Prevent high-frequency diagnostic data from bloating the database
     # RSSI changes with every BLE advertisement (multiple times per second)
-    _unrecorded_attributes = frozenset({"last_seen", "raw_value"})
+    _unrecorded_attributes = frozenset({"last_seen", "raw_value", "total_commands"})
 
     def __init__(
         self,
         coordinator: BeurerDataUpdateCoordinator,
         device_name: str,
-        description: SensorEntityDescription,
+        description: BeurerSensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._instance = coordinator.instance
         self._device_name = device_name
         self.entity_description = description
-        self._attr_unique_id = f"{format_mac(self._instance.mac)}_{description.key}"
-
-    @property
-    def native_value(self) -> int | str | None:
-        """Return the sensor value."""
-        if self.entity_description.key == "rssi":
-            return self._instance.rssi
-        if self.entity_description.key == "last_notification":
-            return self._instance.last_raw_notification
-        return None
+        self._attr_unique_id = f"{self._instance.formatted_mac}_{description.key}"
+        self._attr_device_info = build_device_info(self._instance, device_name)
+        # Diagnostic sensors follow the connection state, not power state.
+        # Therapy and connection health metrics are tracked from startup and
+        # stay available.
+        self._attr_available = self._source_available()
+        self._attr_native_value = description.value_fn(self._instance)
+        if (attributes := self._compute_extra_state_attributes()) is not None:
+            self._attr_extra_state_attributes = attributes
 
     @property
     def available(self) -> bool:
-        """Return True if entity is available.
+        """Return True if the sensor source is available.
 
-        Availability is based on connection state, not power state.
+        Lamp-backed sensors also require the coordinator; tracked metrics
+        stay available on their own.
         """
-        return self._instance.available
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        mac = format_mac(self._instance.mac)
-        return DeviceInfo(
-            identifiers={(DOMAIN, mac)},
-            name=self._device_name,
-            manufacturer="Beurer",
-            model=detect_model(self._device_name),
-            sw_version=VERSION,
-            connections={(CONNECTION_BLUETOOTH, mac)},
-        )
-
-
-class BeurerTherapySensor(CoordinatorEntity[BeurerDataUpdateCoordinator], SensorEntity):
-    """Sensor for tracking light exposure.
-
-    NOTE: This is a lifestyle/wellness feature for personal tracking.
-    It is NOT a medical device and should not be used for medical purposes.
-    """
-
-    _attr_has_entity_name = True
-
-    def __init__(
-        self,
-        coordinator: BeurerDataUpdateCoordinator,
-        device_name: str,
-        description: SensorEntityDescription,
-    ) -> None:
-        """Initialize the therapy sensor."""
-        super().__init__(coordinator)
-        self._instance = coordinator.instance
-        self._device_name = device_name
-        self.entity_description = description
-        self._attr_unique_id = f"{format_mac(self._instance.mac)}_{description.key}"
-
-    @property
-    def native_value(self) -> float | int | None:
-        """Return the sensor value."""
-        key = self.entity_description.key
-        if key == "therapy_today":
-            return round(self._instance.therapy_today_minutes, 1)
-        if key == "therapy_week":
-            return round(self._instance.therapy_week_minutes, 1)
-        if key == "therapy_progress":
-            return self._instance.therapy_goal_progress_pct
-        return None
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return True  # Always available as tracking persists
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        mac = format_mac(self._instance.mac)
-        return DeviceInfo(
-            identifiers={(DOMAIN, mac)},
-            name=self._device_name,
-            manufacturer="Beurer",
-            model=detect_model(self._device_name),
-            sw_version=VERSION,
-            connections={(CONNECTION_BLUETOOTH, mac)},
-        )
-
-
-class BeurerConnectionHealthSensor(
-    CoordinatorEntity[BeurerDataUpdateCoordinator], SensorEntity
-):
-    """Sensor for monitoring connection health metrics.
-
-    Provides diagnostic information about BLE connection stability:
-    - Reconnect count: Number of reconnections since startup
-    - Command success rate: Percentage of successful BLE commands
-    - Connection uptime: Seconds since current connection established
-    """
-
-    _attr_has_entity_name = True
-
-    # Prevent high-frequency updates from bloating the database
-    _unrecorded_attributes = frozenset({"total_commands"})
-
-    def __init__(
-        self,
-        coordinator: BeurerDataUpdateCoordinator,
-        device_name: str,
-        description: SensorEntityDescription,
-    ) -> None:
-        """Initialize the connection health sensor."""
-        super().__init__(coordinator)
-        self._instance = coordinator.instance
-        self._device_name = device_name
-        self.entity_description = description
-        self._attr_unique_id = f"{format_mac(self._instance.mac)}_{description.key}"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the sensor value."""
-        key = self.entity_description.key
-        if key == "reconnect_count":
-            return self._instance.reconnect_count
-        if key == "command_success_rate":
-            return self._instance.command_success_rate
-        if key == "connection_uptime":
-            return self._instance.connection_uptime_seconds
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, int] | None:
-        """Return additional state attributes."""
-        if self.entity_description.key == "command_success_rate":
-            return {"total_commands": self._instance.total_commands}
-        return None
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        # These metrics are always available (they track from startup)
-        return True
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        mac = format_mac(self._instance.mac)
-        return DeviceInfo(
-            identifiers={(DOMAIN, mac)},
-            name=self._device_name,
-            manufacturer="Beurer",
-            model=detect_model(self._device_name),
-            sw_version=VERSION,
-            connections={(CONNECTION_BLUETOOTH, mac)},
+        if self.entity_description.available_fn is None:
+            return True
+        return super().available and self._attr_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached value and availability, write state only on change.
+
+        Values, including the rounded therapy minutes, are computed here once
+        per update rather than on every state read. Updates that change
+        nothing observable are dropped, as is RSSI jitter below the
+        description's min_change since RSSI is pushed at advertisement rate.
+        """
+        description = self.entity_description
+        was_available = self._attr_available
+        self._attr_available = self._source_available()
+        value = description.value_fn(self._instance)
+        attributes = self._compute_extra_state_attributes()
+        if (
+            self._attr_available == was_available
+            and attributes == self.extra_state_attributes
+            and self._is_insignificant_change(value)
+        ):
+            return
+        self._attr_native_value = value
+        if attributes is not None:
+            self._attr_extra_state_attributes = attributes
+        super()._handle_coordinator_update()
+
+    def _source_available(self) -> bool:
+        """Return the availability reported by the description's getter."""
+        if (available_fn := self.entity_description.available_fn) is None:
+            return True
+        return available_fn(self._instance)
+
+    def _compute_extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return extra state attributes for sensors that expose any."""
+        if (attributes_fn := self.entity_description.attributes_fn) is None:
+            return None
+        return attributes_fn(self._instance)
+
+    def _is_insignificant_change(self, value: StateType) -> bool:
+        """Return True if value does not differ meaningfully from the state."""
+        last = self._attr_native_value
+        if value == last:
+            return True
+        min_change = self.entity_description.min_change
+        return (
+            min_change is not None
+            and isinstance(value, int | float)
+            and isinstance(last, int | float)
+            and abs(value - last) < min_change
         )
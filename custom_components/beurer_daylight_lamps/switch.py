@@ -2,20 +2,18 @@
 
 from __future__ import annotations
 
+from itertools import chain
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.const import EntityCategory
-from homeassistant.helpers.device_registry import (
-    CONNECTION_BLUETOOTH,
-    DeviceInfo,
-    format_mac,
-)
+from homeassistant.core import callback
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, LOGGER, VERSION, detect_model
+from .const import LOGGER
 from .coordinator import BeurerDataUpdateCoordinator
+from .entity import build_device_info
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -23,6 +21,11 @@ if TYPE_CHECKING:
 
     from .data import BeurerConfigEntry
 
+# Static "description" state attribute of the Adaptive Lighting switch
+_ADAPTIVE_LIGHTING_ATTR_DESCRIPTION = (
+    "Controls whether Adaptive Lighting can adjust this lamp"
+)
+
 SWITCH_DESCRIPTIONS = [
     SwitchEntityDescription(
         key="adaptive_lighting",
@@ -58,20 +61,20 @@ async def async_setup_entry(
     coordinator = entry.runtime_data.coordinator
     name = entry.data.get("name", "Beurer Lamp")
 
-    entities: list[SwitchEntity] = [
-        BeurerAdaptiveLightingSwitch(coordinator, name, entry.entry_id, desc)
-        for desc in SWITCH_DESCRIPTIONS
-    ]
-    # Add device hardware switches (feedback sound, fade)
-    entities.extend(
-        [
-            BeurerDeviceSwitch(coordinator, name, desc)
-            for desc in DEVICE_SWITCH_DESCRIPTIONS
-        ]
+    async_add_entities(
+        chain(
+            (
+                BeurerAdaptiveLightingSwitch(coordinator, name, entry.entry_id, desc)
+                for desc in SWITCH_DESCRIPTIONS
+            ),
+            # Device hardware switches (feedback sound, fade)
+            (
+                BeurerDeviceSwitch(coordinator, name, desc)
+                for desc in DEVICE_SWITCH_DESCRIPTIONS
+            ),
+        )
     )
 
-    async_add_entities(entities)
-
 
 class BeurerAdaptiveLightingSwitch(
     CoordinatorEntity[BeurerDataUpdateCoordinator], SwitchEntity, RestoreEntity
@@ -103,8 +106,11 @@ class BeurerAdaptiveLightingSwitch(
         self._entry_id = entry_id
         self._device_name = name
         self.entity_description = description
-        self._attr_unique_id = f"{format_mac(self._instance.mac)}_{description.key}"
+        self._attr_unique_id = f"{self._instance.formatted_mac}_{description.key}"
+        self._attr_device_info = build_device_info(self._instance, self._device_name)
         self._is_on: bool = True  # Default: Adaptive Lighting enabled
+        self._attr_available = self._instance.available
+        self._update_extra_state_attributes()
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -124,45 +130,50 @@ class BeurerAdaptiveLightingSwitch(
     async def async_will_remove_from_hass(self) -> None:
         """Run when entity will be removed from hass."""
         await super().async_will_remove_from_hass()
-        if hasattr(self._instance, "adaptive_lighting_switch"):
-            delattr(self._instance, "adaptive_lighting_switch")
+        self._instance.adaptive_lighting_switch = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached availability and attributes, write state only on change.
+
+        _is_on changes are written directly by the turn on/off handlers.
+        """
+        instance = self._instance
+        attributes = self._attr_extra_state_attributes
+        if (
+            instance.available == self._attr_available
+            and instance._therapy_active == attributes["therapy_mode_active"]
+            and self._current_effect() == attributes["current_effect"]
+        ):
+            return
+        self._attr_available = instance.available
+        self._update_extra_state_attributes()
+        super()._handle_coordinator_update()
+
+    def _current_effect(self) -> str | None:
+        """Return the active effect, or None when no effect is playing."""
+        effect = self._instance.effect
+        return effect if effect != "Off" else None
+
+    @callback
+    def _update_extra_state_attributes(self) -> None:
+        """Cache the extra state attributes from the current instance state."""
+        self._attr_extra_state_attributes = {
+            "description": _ADAPTIVE_LIGHTING_ATTR_DESCRIPTION,
+            "therapy_mode_active": self._instance._therapy_active,
+            "current_effect": self._current_effect(),
+        }
 
     @property
     def available(self) -> bool:
-        """Return True if entity is available."""
-        return self._instance.available
+        """Return True if the coordinator and the lamp are available."""
+        return super().available and self._attr_available
 
     @property
     def is_on(self) -> bool:
         """Return True if Adaptive Lighting is enabled."""
         return self._is_on
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info for device registry."""
-        mac = format_mac(self._instance.mac)
-        return DeviceInfo(
-            identifiers={(DOMAIN, mac)},
-            name=self._device_name,
-            manufacturer="Beurer",
-            model=detect_model(self._device_name),
-            sw_version=VERSION,
-            connections={(CONNECTION_BLUETOOTH, mac)},
-        )
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        return {
-            "description": "Controls whether Adaptive Lighting can adjust this lamp",
-            "therapy_mode_active": self._instance._therapy_active
-            if hasattr(self._instance, "_therapy_active")
-            else False,
-            "current_effect": self._instance.effect
-            if self._instance.effect != "Off"
-            else None,
-        }
-
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enable Adaptive Lighting for this lamp."""
         LOGGER.info("Enabling Adaptive Lighting for %s", self._device_name)
@@ -192,10 +203,7 @@ class BeurerAdaptiveLightingSwitch(
             return True
 
         # Therapy mode active - don't override
-        return (
-            hasattr(self._instance, "_therapy_active")
-            and self._instance._therapy_active
-        )
+        return self._instance._therapy_active
 
 
 class BeurerDeviceSwitch(CoordinatorEntity[BeurerDataUpdateCoordinator], SwitchEntity):
@@ -221,12 +229,20 @@ class BeurerDeviceSwitch(CoordinatorEntity[BeurerDataUpdateCoordinator], SwitchE
         self._instance = coordinator.instance
         self._device_name = name
         self.entity_description = description
-        self._attr_unique_id = f"{format_mac(self._instance.mac)}_{description.key}"
+        self._attr_unique_id = f"{self._instance.formatted_mac}_{description.key}"
+        self._attr_device_info = build_device_info(self._instance, self._device_name)
+        self._attr_available = self._instance.available
 
     @property
     def available(self) -> bool:
-        """Return True if entity is available."""
-        return self._instance.available
+        """Return True if the coordinator and the lamp are both available."""
+        return super().available and self._attr_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached availability and write state."""
+        self._attr_available = self._instance.available
+        super()._handle_coordinator_update()
 
     @property
     def is_on(self) -> bool | None:
@@ -237,19 +253,6 @@ class BeurerDeviceSwitch(CoordinatorEntity[BeurerDataUpdateCoordinator], SwitchE
             return self._instance.fade_enabled
         return None
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info for device registry."""
-        mac = format_mac(self._instance.mac)
-        return DeviceInfo(
-            identifiers={(DOMAIN, mac)},
-            name=self._device_name,
-            manufacturer="Beurer",
-            model=detect_model(self._device_name),
-            sw_version=VERSION,
-            connections={(CONNECTION_BLUETOOTH, mac)},
-        )
-
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enable the device setting."""
         if self.entity_description.key == "feedback_sound":
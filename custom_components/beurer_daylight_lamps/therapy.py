@@ -9,21 +9,32 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from enum import Enum
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from bleak.exc import BleakError
 from homeassistant.util.color import color_temperature_to_rgb
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from homeassistant.core import HomeAssistant
 
     from .beurer_daylight_lamps import BeurerInstance
 
 from .const import LOGGER
 
+# Simulations convert the same integer kelvin values run after run
+_color_temperature_to_rgb = lru_cache(maxsize=512)(color_temperature_to_rgb)
+
+_ONE_DAY = timedelta(days=1)
+# Therapy history is kept for one week
+_SEVEN_DAYS = timedelta(days=7)
+
 
 class SunriseProfile(Enum):
     """Predefined sunrise profiles."""
@@ -34,7 +45,7 @@ class SunriseProfile(Enum):
     THERAPY = "therapy"  # Optimized for light therapy (ends at 5300K)
 
 
-@dataclass
+@dataclass(slots=True)
 class SunriseConfig:
     """Configuration for sunrise profile."""
 
@@ -78,7 +89,7 @@ SUNRISE_PROFILES: dict[SunriseProfile, SunriseConfig] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class TherapySession:
     """Tracks a single therapy session."""
 
@@ -90,22 +101,37 @@ class TherapySession:
     @property
     def duration_minutes(self) -> float:
         """Calculate session duration in minutes."""
+        # Only open sessions need the clock
         end = self.end_time or datetime.now(tz=UTC)
         return (end - self.start_time).total_seconds() / 60
 
+    def duration_minutes_at(self, now: datetime) -> float:
+        """Calculate session duration in minutes, open sessions ending at now."""
+        end = self.end_time or now
+        return (end - self.start_time).total_seconds() / 60
+
     @property
     def is_therapy_light(self) -> bool:
         """Check if this qualifies as therapy light (bright + cool)."""
         return self.color_temp_kelvin >= 5000 and self.brightness_pct >= 80
 
 
-@dataclass
+@dataclass(slots=True)
 class TherapyTracker:
     """Tracks daily light therapy exposure."""
 
-    sessions: list[TherapySession] = field(default_factory=list)
+    # Completed therapy sessions ordered by start time. Only end_session
+    # appends (in time order) and only cleanup_old_sessions removes (from
+    # the left); callers treat it as read-only. One session is active at a time
+    sessions: deque[TherapySession] = field(default_factory=deque)
     daily_goal_minutes: int = 30
     _current_session: TherapySession | None = None
+    # Completed-session totals per period: ((since, version), minutes)
+    _history_totals: dict[str, tuple[tuple[datetime, int], float]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Bumped whenever end_session or cleanup_old_sessions changes the history
+    _history_version: int = field(default=0, init=False, repr=False, compare=False)
 
     @property
     def has_active_session(self) -> bool:
@@ -155,62 +181,76 @@ class TherapyTracker:
         session = self._current_session
 
         # Only track sessions that qualify as therapy
-        if session.is_therapy_light and session.duration_minutes >= 1:
+        duration = session.duration_minutes
+        if session.is_therapy_light and duration >= 1:
             self.sessions.append(session)
-            LOGGER.debug(
-                "Ended therapy session: %.1f minutes",
-                session.duration_minutes,
-            )
+            self._history_version += 1
+            LOGGER.debug("Ended therapy session: %.1f minutes", duration)
 
         self._current_session = None
         return session
 
     def cleanup_old_sessions(self) -> None:
         """Remove sessions older than 7 days."""
-        cutoff = datetime.now(tz=UTC) - timedelta(days=7)
-        self.sessions = [s for s in self.sessions if s.start_time > cutoff]
+        cutoff = datetime.now(tz=UTC) - _SEVEN_DAYS
+        while self.sessions and self.sessions[0].start_time <= cutoff:
+            self.sessions.popleft()
+            self._history_version += 1
+
+    def _history_minutes(self, period: str, since: datetime) -> float:
+        """Return minutes of completed sessions started since a time.
+
+        end_session only records sessions that qualify as therapy light, so
+        history entries are summed without re-checking them. Completed
+        sessions never change, so the sum is only recomputed when the period
+        rolls over or the session history is modified.
+        """
+        key = (since, self._history_version)
+        cached = self._history_totals.get(period)
+        if cached is not None and cached[0] == key:
+            return cached[1]
 
-    @property
-    def today_minutes(self) -> float:
-        """Calculate total therapy minutes today."""
-        today = datetime.now(tz=UTC).date()
         total = 0.0
+        # Newest first; history is in start order, so stop at the first
+        # session that started before the period
+        for session in reversed(self.sessions):
+            if session.start_time < since:
+                break
+            total += session.duration_minutes
 
-        for session in self.sessions:
-            if session.start_time.date() == today and session.is_therapy_light:
-                total += session.duration_minutes
+        self._history_totals[period] = (key, total)
+        return total
 
-        # Add current session if active and qualifies
+    def _current_minutes(self, since: datetime, now: datetime) -> float:
+        """Return minutes of the active session if it started since a time."""
         if (
             self._current_session
-            and self._current_session.start_time.date() == today
+            and self._current_session.start_time >= since
             and self._current_session.is_therapy_light
         ):
-            total += self._current_session.duration_minutes
+            return self._current_session.duration_minutes_at(now)
+        return 0.0
 
-        return total
+    @property
+    def today_minutes(self) -> float:
+        """Calculate total therapy minutes today."""
+        now = datetime.now(tz=UTC)
+        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        return self._history_minutes("today", today_start) + self._current_minutes(
+            today_start, now
+        )
 
     @property
     def week_minutes(self) -> float:
         """Calculate total therapy minutes this week."""
         now = datetime.now(tz=UTC)
-        week_start = now - timedelta(days=now.weekday())
-        week_start = week_start.replace(hour=0, minute=0, second=0, microsecond=0)
-
-        total = 0.0
-        for session in self.sessions:
-            if session.start_time >= week_start and session.is_therapy_light:
-                total += session.duration_minutes
-
-        # Add current session
-        if (
-            self._current_session
-            and self._current_session.start_time >= week_start
-            and self._current_session.is_therapy_light
-        ):
-            total += self._current_session.duration_minutes
+        week_start = (now - _ONE_DAY * now.weekday()).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
 
-        return total
+        return self._history_minutes("week", week_start) + self._current_minutes(
+            week_start, now
+        )
 
     @property
     def goal_reached(self) -> bool:
@@ -339,13 +379,15 @@ class SunriseSimulation:
 
     async def _apply_with_retry(
         self,
-        action: Any,
+        action: Callable[..., Awaitable[Any]],
+        *args: Any,
         max_retries: int = 3,
     ) -> bool:
         """Apply an action with retry and automatic reconnection.
 
         Args:
             action: Async callable to execute
+            *args: Positional arguments passed to the action
             max_retries: Maximum number of retry attempts
 
         Returns:
@@ -378,7 +420,7 @@ class SunriseSimulation:
                     await asyncio.sleep(1)
 
                 # Execute the action
-                await action()
+                await action(*args)
             except (BleakError, TimeoutError, OSError) as err:
                 LOGGER.warning(
                     "Action failed (attempt %d/%d): %s", attempt + 1, max_retries, err
@@ -390,6 +432,30 @@ class SunriseSimulation:
 
         return False
 
+    def _clock(self) -> float:
+        """Return the loop time that simulation steps are scheduled on."""
+        return asyncio.get_running_loop().time()
+
+    async def _sleep_until(self, deadline: float) -> None:
+        """Sleep until a deadline on the scheduling clock."""
+        await asyncio.sleep(max(0.0, deadline - self._clock()))
+
+    async def _wait_for_next_step(
+        self, start_ts: float, interval: float, step: int, last_step: int
+    ) -> int:
+        """Sleep until the next step is due and return its index.
+
+        Steps are due at start_ts + index * interval on the scheduling clock.
+        If a stall (slow writes, reconnects) has already passed the next
+        deadline, return the latest due step right away instead of sending
+        every missed step back to back.
+        """
+        due = int((self._clock() - start_ts) // interval)
+        if due > step:
+            return min(due, last_step)
+        await self._sleep_until(start_ts + (step + 1) * interval)
+        return step + 1
+
     async def _run_sunrise(
         self,
         duration_minutes: int,
@@ -414,25 +480,32 @@ class SunriseSimulation:
             # Sunrise runs 15-30min; allow ~2min of recovery (8 x 15s retry wait)
             max_consecutive_failures = 8
 
+            # Precompute (kelvin, brightness %, RGB, brightness 0-255) for
+            # every step so the timed loop only talks to the lamp
+            step_table: list[tuple[int, int, tuple[int, int, int], int]] = []
             for i in range(steps + 1):
-                if not self._running:
-                    break
-
-                self._current_step = i
-
-                # Calculate current values
                 kelvin = int(config.start_kelvin + kelvin_step * i)
                 brightness_pct = int(config.start_brightness_pct + brightness_step * i)
-                brightness_255 = int(brightness_pct / 100 * 255)
-
                 # Convert kelvin to RGB (convert floats to ints)
-                rgb_float = color_temperature_to_rgb(kelvin)
-                rgb: tuple[int, int, int] = (
-                    int(rgb_float[0]),
-                    int(rgb_float[1]),
-                    int(rgb_float[2]),
+                rgb_float = _color_temperature_to_rgb(kelvin)
+                step_table.append(
+                    (
+                        kelvin,
+                        brightness_pct,
+                        (int(rgb_float[0]), int(rgb_float[1]), int(rgb_float[2])),
+                        int(brightness_pct / 100 * 255),
+                    )
                 )
 
+            # Schedule steps against absolute deadlines so BLE write and retry
+            # time does not accumulate as drift over the whole simulation
+            start_ts = self._clock()
+
+            i = 0
+            while self._running:
+                kelvin, brightness_pct, rgb, brightness_255 = step_table[i]
+                self._current_step = i
+
                 LOGGER.debug(
                     "Sunrise step %d/%d: %dK @ %d%%",
                     i + 1,
@@ -444,11 +517,10 @@ class SunriseSimulation:
                 # Apply to lamp with retry logic
                 # Use fast method optimized for sequential updates (no redundant
                 # mode switches, effect clears, or status requests)
-                # Use default args to bind loop variable values
                 success = await self._apply_with_retry(
-                    lambda _r=rgb, _b=brightness_255: (
-                        self._instance.set_color_with_brightness_fast(_r, _b)
-                    )
+                    self._instance.set_color_with_brightness_fast,
+                    rgb,
+                    brightness_255,
                 )
 
                 if success:
@@ -467,10 +539,9 @@ class SunriseSimulation:
                         )
                         break
 
-                if i < steps:
-                    # Wait for next step - interval already accounts for duration
-                    # Add small buffer to prevent overwhelming the device
-                    await asyncio.sleep(interval)
+                if i == steps:
+                    break
+                i = await self._wait_for_next_step(start_ts, interval, i, steps)
 
             # Request final status to sync state after simulation
             if self._running:
@@ -501,13 +572,19 @@ class SunriseSimulation:
         consecutive_failures = 0
         max_consecutive_failures = 5
 
+        # Precompute (brightness %, brightness 0-255) for every step
+        step_table: list[tuple[int, int]] = []
         for i in range(steps + 1):
-            if not self._running:
-                break
+            brightness_pct = int(start_brightness_pct - brightness_step * i)
+            step_table.append((brightness_pct, int(brightness_pct / 100 * 255)))
+
+        # Schedule steps against absolute deadlines to avoid cumulative drift
+        start_ts = self._clock()
 
+        i = 0
+        while self._running:
+            brightness_pct, brightness_255 = step_table[i]
             self._current_step = i
-            brightness_pct = int(start_brightness_pct - brightness_step * i)
-            brightness_255 = int(brightness_pct / 100 * 255)
 
             LOGGER.debug(
                 "Sunset step %d/%d: %d%%",
@@ -516,14 +593,13 @@ class SunriseSimulation:
                 brightness_pct,
             )
 
-            # Use default args to bind loop variable values
             if brightness_pct <= 0:
                 success = await self._apply_with_retry(self._instance.turn_off)
             else:
                 success = await self._apply_with_retry(
-                    lambda _r=warm_rgb, _b=brightness_255: (
-                        self._instance.set_color_with_brightness_fast(_r, _b)
-                    )
+                    self._instance.set_color_with_brightness_fast,
+                    warm_rgb,
+                    brightness_255,
                 )
 
             if success:
@@ -542,8 +618,9 @@ class SunriseSimulation:
                     )
                     break
 
-            if i < steps:
-                await asyncio.sleep(interval)
+            if i == steps:
+                break
+            i = await self._wait_for_next_step(start_ts, interval, i, steps)
 
     async def _run_sunset(
         self,
@@ -566,7 +643,7 @@ class SunriseSimulation:
             interval = duration_minutes * 60 / steps
             brightness_step = (start_brightness_pct - end_brightness_pct) / steps
 
-            warm_rgb_float = color_temperature_to_rgb(2700)
+            warm_rgb_float = _color_temperature_to_rgb(2700)
             warm_rgb: tuple[int, int, int] = (
                 int(warm_rgb_float[0]),
                 int(warm_rgb_float[1]),
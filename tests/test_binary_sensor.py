@@ -66,6 +66,7 @@ class TestBeurerBinarySensor:
         """Create a mock BeurerInstance."""
         instance = MagicMock()
         instance.mac = "AA:BB:CC:DD:EE:FF"
+        instance.formatted_mac = "aa:bb:cc:dd:ee:ff"
         instance.is_connected = True
         instance.ble_available = True
         instance.set_update_callback = MagicMock()
@@ -190,6 +191,7 @@ class TestBeurerTherapyBinarySensor:
         """Create a mock BeurerInstance."""
         instance = MagicMock()
         instance.mac = "AA:BB:CC:DD:EE:FF"
+        instance.formatted_mac = "aa:bb:cc:dd:ee:ff"
         instance.therapy_goal_reached = False
         instance.set_update_callback = MagicMock()
         instance.remove_update_callback = MagicMock()
@@ -297,6 +299,7 @@ class TestAsyncSetupEntry:
         """Create a mock BeurerInstance."""
         instance = MagicMock()
         instance.mac = "AA:BB:CC:DD:EE:FF"
+        instance.formatted_mac = "aa:bb:cc:dd:ee:ff"
         return instance
 
     @pytest.mark.asyncio
@@ -19,6 +19,7 @@ def mock_instance() -> MagicMock:
     """Create a mock BeurerInstance."""
     instance = MagicMock()
     instance.mac = "AA:BB:CC:DD:EE:FF"
+    instance.formatted_mac = "aa:bb:cc:dd:ee:ff"
     instance.available = True
     instance.is_on = True
     instance.turn_on = AsyncMock()
@@ -44,11 +45,13 @@ class TestBeurerButton:
         assert button.unique_id == expected_id
 
     def test_identify_available(self, mock_coordinator: MagicMock) -> None:
-        """Test identify button availability."""
+        """Test identify button availability follows coordinator updates."""
         button = BeurerButton(mock_coordinator, "Test Lamp", BUTTON_DESCRIPTIONS[0])
         assert button.available is True
 
         mock_coordinator.instance.available = False
+        with patch.object(button, "async_write_ha_state"):
+            button._handle_coordinator_update()
         assert button.available is False
 
     def test_reconnect_always_available(self, mock_coordinator: MagicMock) -> None:
@@ -115,6 +118,7 @@ class TestAsyncSetupEntry:
         """Create a mock BeurerInstance."""
         instance = MagicMock()
         instance.mac = "AA:BB:CC:DD:EE:FF"
+        instance.formatted_mac = "aa:bb:cc:dd:ee:ff"
         return instance
 
     @pytest.fixture
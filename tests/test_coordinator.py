@@ -259,6 +259,10 @@ class TestPushUpdates:
 
         with patch.object(coordinator, "async_set_updated_data") as mock_set:
             coordinator._handle_push_update()
+            mock_set.assert_not_called()
+
+            # The scheduled flush distributes the data
+            mock_hass.loop.call_soon.call_args[0][0]()
 
             mock_set.assert_called_once()
             # Verify the data passed matches current state
@@ -266,6 +270,24 @@ class TestPushUpdates:
             assert call_args["is_on"] is True
             assert call_args["available"] is True
 
+    def test_handle_push_update_coalesces_bursts(
+        self, mock_hass: MagicMock, mock_instance: MagicMock
+    ) -> None:
+        """Test a burst of push updates schedules a single flush."""
+        coordinator = BeurerDataUpdateCoordinator(mock_hass, mock_instance, "Test Lamp")
+
+        with patch.object(coordinator, "async_set_updated_data") as mock_set:
+            for _ in range(5):
+                coordinator._handle_push_update()
+            mock_hass.loop.call_soon.assert_called_once()
+
+            mock_hass.loop.call_soon.call_args[0][0]()
+            mock_set.assert_called_once()
+
+            # After the flush the next notification schedules again
+            coordinator._handle_push_update()
+            assert mock_hass.loop.call_soon.call_count == 2
+
 
 # =============================================================================
 # Test Periodic Updates
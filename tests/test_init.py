@@ -17,6 +17,7 @@ async def test_setup_entry_success(hass: HomeAssistant) -> None:
 
     mock_instance = MagicMock()
     mock_instance.mac = "AA:BB:CC:DD:EE:FF"
+    mock_instance.formatted_mac = "aa:bb:cc:dd:ee:ff"
     mock_instance.update = AsyncMock()
     mock_instance.disconnect = AsyncMock()
     mock_instance.set_update_callback = MagicMock()
@@ -79,6 +80,7 @@ async def test_setup_entry_device_not_found(hass: HomeAssistant) -> None:
     """
     mock_instance = MagicMock()
     mock_instance.mac = "AA:BB:CC:DD:EE:FF"
+    mock_instance.formatted_mac = "aa:bb:cc:dd:ee:ff"
     mock_instance._ble_available = False
 
     mock_coordinator = MagicMock()
@@ -42,6 +42,7 @@ def mock_instance() -> MagicMock:
     """Create a mock BeurerInstance."""
     instance = MagicMock()
     instance.mac = "AA:BB:CC:DD:EE:FF"
+    instance.formatted_mac = "aa:bb:cc:dd:ee:ff"
     instance.is_on = True
     instance.rgb_color = (255, 128, 64)
     instance.color_brightness = 200
@@ -116,10 +117,12 @@ def test_light_available(mock_coordinator: MagicMock) -> None:
 
     # Available when connected (regardless of power state)
     mock_coordinator.instance.available = True
+    light._update_attrs()
     assert light.available is True
 
     # Unavailable when disconnected
     mock_coordinator.instance.available = False
+    light._update_attrs()
     assert light.available is False
 
 
@@ -188,6 +191,23 @@ async def test_turn_off(mock_coordinator: MagicMock) -> None:
     mock_coordinator.instance.turn_off.assert_called_once()
 
 
+def test_coordinator_update_refreshes_attrs(mock_coordinator: MagicMock) -> None:
+    """Test coordinator updates refresh the cached state attributes."""
+    light = BeurerLight(mock_coordinator, "Test", "entry_id")
+    light.async_write_ha_state = MagicMock()
+
+    mock_coordinator.instance.is_on = False
+    mock_coordinator.instance.color_mode = ColorMode.WHITE
+    mock_coordinator.instance.white_brightness = 64
+    light._handle_coordinator_update()
+
+    assert light.is_on is False
+    assert light.brightness == 64
+    assert light.color_mode == ColorMode.WHITE
+    assert light.effect is None
+    light.async_write_ha_state.assert_called_once()
+
+
 # =============================================================================
 # Additional Tests for Full Coverage
 # =============================================================================
@@ -234,6 +254,7 @@ def test_color_temp_kelvin_in_color_temp_mode(mock_coordinator: MagicMock) -> No
 
     light = BeurerLight(mock_coordinator, "Test", "entry_id")
     light._color_temp_kelvin = 4000
+    light._update_attrs()
 
     assert light.color_temp_kelvin == 4000
 
@@ -244,6 +265,7 @@ def test_color_temp_kelvin_not_in_color_temp_mode(mock_coordinator: MagicMock) -
 
     light = BeurerLight(mock_coordinator, "Test", "entry_id")
     light._color_temp_kelvin = 4000
+    light._update_attrs()
 
     assert light.color_temp_kelvin is None
 
@@ -271,6 +293,7 @@ def test_color_mode_color_temp(mock_coordinator: MagicMock) -> None:
 
     light = BeurerLight(mock_coordinator, "Test", "entry_id")
     light._color_temp_kelvin = 4000
+    light._update_attrs()
 
     assert light.color_mode == ColorMode.COLOR_TEMP
 
@@ -412,6 +435,7 @@ class TestAsyncSetupEntry:
         """Create a mock BeurerInstance."""
         instance = MagicMock()
         instance.mac = "AA:BB:CC:DD:EE:FF"
+        instance.formatted_mac = "aa:bb:cc:dd:ee:ff"
         return instance
 
     @pytest.fixture
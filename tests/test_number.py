@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.components.light import ColorMode
@@ -29,6 +29,7 @@ class TestBeurerBrightnessNumber:
         """Create a mock BeurerInstance."""
         instance = MagicMock()
         instance.mac = "AA:BB:CC:DD:EE:FF"
+        instance.formatted_mac = "aa:bb:cc:dd:ee:ff"
         instance.white_brightness = 200
         instance.color_brightness = 150
         instance.available = True
@@ -94,7 +95,7 @@ class TestBeurerBrightnessNumber:
         assert number.native_value is None
 
     def test_available(self, mock_coordinator: MagicMock) -> None:
-        """Test available property."""
+        """Test available follows the instance on coordinator updates."""
         description = next(
             d for d in NUMBER_DESCRIPTIONS if d.key == "white_brightness"
         )
@@ -103,6 +104,8 @@ class TestBeurerBrightnessNumber:
         assert number.available is True
 
         mock_coordinator.instance.available = False
+        with patch.object(number, "async_write_ha_state"):
+            number._handle_coordinator_update()
         assert number.available is False
 
     def test_device_info(self, mock_coordinator: MagicMock) -> None:
@@ -158,6 +161,7 @@ class TestBeurerTimerNumber:
         """Create a mock BeurerInstance."""
         instance = MagicMock()
         instance.mac = "AA:BB:CC:DD:EE:FF"
+        instance.formatted_mac = "aa:bb:cc:dd:ee:ff"
         instance.available = True
         instance.color_mode = ColorMode.RGB
         instance.set_update_callback = MagicMock()
@@ -254,6 +258,7 @@ class TestBeurerTherapyGoalNumber:
         """Create a mock BeurerInstance."""
         instance = MagicMock()
         instance.mac = "AA:BB:CC:DD:EE:FF"
+        instance.formatted_mac = "aa:bb:cc:dd:ee:ff"
         instance.therapy_daily_goal = 30
         instance.set_update_callback = MagicMock()
         instance.remove_update_callback = MagicMock()
@@ -317,6 +322,7 @@ class TestAsyncSetupEntry:
         """Create a mock BeurerInstance."""
         instance = MagicMock()
         instance.mac = "AA:BB:CC:DD:EE:FF"
+        instance.formatted_mac = "aa:bb:cc:dd:ee:ff"
         instance.is_wl = False  # TL model by default (no WL entities)
         return instance
 
@@ -251,26 +251,47 @@ class TestAsyncCreateFixFlow:
     @pytest.mark.asyncio
     async def test_creates_device_not_found_flow(self, hass: HomeAssistant) -> None:
         """Test creating device not found repair flow."""
-        flow = await async_create_fix_flow(
-            hass,
-            "device_not_found_test_entry",
-            {"name": "Test Lamp"},
-        )
+        with patch.object(
+            hass.config_entries, "async_get_entry", return_value=MagicMock()
+        ) as mock_get_entry:
+            flow = await async_create_fix_flow(
+                hass,
+                "device_not_found_test_entry",
+                {"name": "Test Lamp"},
+            )
 
         assert isinstance(flow, DeviceNotFoundRepairFlow)
+        mock_get_entry.assert_called_once_with("test_entry")
 
     @pytest.mark.asyncio
     async def test_creates_initialization_failed_flow(
         self, hass: HomeAssistant
     ) -> None:
         """Test creating initialization failed repair flow."""
-        flow = await async_create_fix_flow(
-            hass,
-            "initialization_failed_test_entry",
-            {"name": "Test Lamp", "error": "Connection failed"},
-        )
+        with patch.object(
+            hass.config_entries, "async_get_entry", return_value=MagicMock()
+        ) as mock_get_entry:
+            flow = await async_create_fix_flow(
+                hass,
+                "initialization_failed_test_entry",
+                {"name": "Test Lamp", "error": "Connection failed"},
+            )
 
         assert isinstance(flow, InitializationFailedRepairFlow)
+        mock_get_entry.assert_called_once_with("test_entry")
+
+    @pytest.mark.asyncio
+    async def test_raises_for_missing_entry(self, hass: HomeAssistant) -> None:
+        """Test that an issue for a removed config entry raises ValueError."""
+        with (
+            patch.object(hass.config_entries, "async_get_entry", return_value=None),
+            pytest.raises(ValueError, match="Config entry not found"),
+        ):
+            await async_create_fix_flow(
+                hass,
+                "device_not_found_test_entry",
+                {},
+            )
 
     @pytest.mark.asyncio
     async def test_raises_for_unknown_issue(self, hass: HomeAssistant) -> None:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.helpers.device_registry import format_mac
@@ -20,6 +20,7 @@ def mock_instance() -> MagicMock:
     """Create a mock BeurerInstance."""
     instance = MagicMock()
     instance.mac = "AA:BB:CC:DD:EE:FF"
+    instance.formatted_mac = "aa:bb:cc:dd:ee:ff"
     instance.available = True
     instance.effect = "Off"
     instance.set_effect = AsyncMock()
@@ -72,6 +73,8 @@ class TestBeurerEffectSelect:
         assert select.available is True
 
         mock_coordinator.instance.available = False
+        with patch.object(select, "async_write_ha_state"):
+            select._handle_coordinator_update()
         assert select.available is False
 
     def test_instance_reference(self, mock_coordinator: MagicMock) -> None:
@@ -114,6 +117,7 @@ class TestAsyncSetupEntry:
         """Create a mock BeurerInstance."""
         instance = MagicMock()
         instance.mac = "AA:BB:CC:DD:EE:FF"
+        instance.formatted_mac = "aa:bb:cc:dd:ee:ff"
         return instance
 
     @pytest.fixture
@@ -1,6 +1,6 @@
 """Test Beurer Daylight Lamps sensor entity."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
@@ -12,10 +12,10 @@ from homeassistant.const import (
 from homeassistant.helpers.entity import EntityCategory
 
 from custom_components.beurer_daylight_lamps.sensor import (
+    CONNECTION_HEALTH_SENSOR_DESCRIPTIONS,
     SENSOR_DESCRIPTIONS,
     THERAPY_SENSOR_DESCRIPTIONS,
     BeurerSensor,
-    BeurerTherapySensor,
 )
 from tests.conftest import create_mock_coordinator
 
@@ -69,6 +69,7 @@ def mock_instance() -> MagicMock:
     """Create a mock BeurerInstance."""
     instance = MagicMock()
     instance.mac = "AA:BB:CC:DD:EE:FF"
+    instance.formatted_mac = "aa:bb:cc:dd:ee:ff"
     instance.rssi = -60
     instance.available = True
     instance.last_raw_notification = "test_notification"
@@ -124,6 +125,58 @@ def test_sensor_unavailable_when_disconnected(mock_coordinator: MagicMock) -> No
     assert sensor.available is False
 
 
+def test_sensor_availability_follows_coordinator_update(
+    mock_coordinator: MagicMock,
+) -> None:
+    """Test cached availability is refreshed on coordinator updates."""
+    sensor = BeurerSensor(mock_coordinator, "Test Lamp", SENSOR_DESCRIPTIONS[0])
+    assert sensor.available is True
+
+    mock_coordinator.instance.available = False
+    with patch.object(sensor, "async_write_ha_state") as mock_write:
+        sensor._handle_coordinator_update()
+
+    assert sensor.available is False
+    mock_write.assert_called_once()
+
+
+def test_sensor_skips_unchanged_updates(mock_coordinator: MagicMock) -> None:
+    """Test coordinator updates that change nothing do not write state."""
+    mock_coordinator.instance.reconnect_count = 3
+    sensor = BeurerSensor(
+        mock_coordinator, "Test Lamp", CONNECTION_HEALTH_SENSOR_DESCRIPTIONS[0]
+    )
+
+    with patch.object(sensor, "async_write_ha_state") as mock_write:
+        sensor._handle_coordinator_update()
+        mock_write.assert_not_called()
+
+        mock_coordinator.instance.reconnect_count = 4
+        sensor._handle_coordinator_update()
+        mock_write.assert_called_once()
+
+
+def test_rssi_sensor_skips_small_changes(mock_coordinator: MagicMock) -> None:
+    """Test RSSI jitter below the threshold does not write state."""
+    sensor = BeurerSensor(mock_coordinator, "Test Lamp", SENSOR_DESCRIPTIONS[0])
+
+    with patch.object(sensor, "async_write_ha_state") as mock_write:
+        mock_coordinator.instance.rssi = -61
+        sensor._handle_coordinator_update()
+        assert mock_write.call_count == 0
+        assert sensor.native_value == -60
+
+        mock_coordinator.instance.rssi = -63
+        sensor._handle_coordinator_update()
+        assert mock_write.call_count == 1
+        assert sensor.native_value == -63
+
+        # Availability changes are always written
+        mock_coordinator.instance.available = False
+        sensor._handle_coordinator_update()
+        assert mock_write.call_count == 2
+
+
 def test_sensor_device_info(mock_coordinator: MagicMock) -> None:
     """Test sensor device info with normalized MAC."""
     sensor = BeurerSensor(mock_coordinator, "Test TL100", SENSOR_DESCRIPTIONS[0])
@@ -155,9 +208,7 @@ def test_sensor_instance_reference(mock_coordinator: MagicMock) -> None:
 def test_therapy_sensor_today_value(mock_coordinator: MagicMock) -> None:
     """Test therapy sensor returns today's minutes."""
     mock_coordinator.instance.therapy_today_minutes = 15.567
-    sensor = BeurerTherapySensor(
-        mock_coordinator, "Test Lamp", THERAPY_SENSOR_DESCRIPTIONS[0]
-    )
+    sensor = BeurerSensor(mock_coordinator, "Test Lamp", THERAPY_SENSOR_DESCRIPTIONS[0])
 
     assert sensor.native_value == 15.6  # Rounded to 1 decimal
 
@@ -165,19 +216,26 @@ def test_therapy_sensor_today_value(mock_coordinator: MagicMock) -> None:
 def test_therapy_sensor_week_value(mock_coordinator: MagicMock) -> None:
     """Test therapy sensor returns week's minutes."""
     mock_coordinator.instance.therapy_week_minutes = 120.234
-    sensor = BeurerTherapySensor(
-        mock_coordinator, "Test Lamp", THERAPY_SENSOR_DESCRIPTIONS[1]
-    )
+    sensor = BeurerSensor(mock_coordinator, "Test Lamp", THERAPY_SENSOR_DESCRIPTIONS[1])
 
     assert sensor.native_value == 120.2  # Rounded to 1 decimal
 
 
+def test_therapy_sensor_value_refreshed_on_update(mock_coordinator: MagicMock) -> None:
+    """Test the cached therapy value is recomputed on coordinator updates."""
+    sensor = BeurerSensor(mock_coordinator, "Test Lamp", THERAPY_SENSOR_DESCRIPTIONS[0])
+
+    mock_coordinator.instance.therapy_today_minutes = 20.04
+    with patch.object(sensor, "async_write_ha_state"):
+        sensor._handle_coordinator_update()
+
+    assert sensor.native_value == 20.0
+
+
 def test_therapy_sensor_progress_value(mock_coordinator: MagicMock) -> None:
     """Test therapy sensor returns goal progress percentage."""
     mock_coordinator.instance.therapy_goal_progress_pct = 75
-    sensor = BeurerTherapySensor(
-        mock_coordinator, "Test Lamp", THERAPY_SENSOR_DESCRIPTIONS[2]
-    )
+    sensor = BeurerSensor(mock_coordinator, "Test Lamp", THERAPY_SENSOR_DESCRIPTIONS[2])
 
     assert sensor.native_value == 75
 
@@ -186,26 +244,41 @@ def test_therapy_sensor_always_available(mock_coordinator: MagicMock) -> None:
     """Test therapy sensor is always available (tracking persists)."""
     mock_coordinator.instance.available = False  # Device disconnected
 
-    sensor = BeurerTherapySensor(
-        mock_coordinator, "Test Lamp", THERAPY_SENSOR_DESCRIPTIONS[0]
-    )
+    sensor = BeurerSensor(mock_coordinator, "Test Lamp", THERAPY_SENSOR_DESCRIPTIONS[0])
 
     # Therapy sensors are always available because tracking persists
     assert sensor.available is True
 
 
+def test_tracked_sensors_ignore_coordinator_status(
+    mock_coordinator: MagicMock,
+) -> None:
+    """Test therapy and health sensors stay available if the coordinator fails."""
+    mock_coordinator.last_update_success = False
+
+    lamp_sensor = BeurerSensor(mock_coordinator, "Test Lamp", SENSOR_DESCRIPTIONS[0])
+    tracked = [
+        BeurerSensor(mock_coordinator, "Test Lamp", desc)
+        for desc in (
+            *THERAPY_SENSOR_DESCRIPTIONS,
+            *CONNECTION_HEALTH_SENSOR_DESCRIPTIONS,
+        )
+    ]
+
+    assert lamp_sensor.available is False
+    assert all(sensor.available for sensor in tracked)
+
+
 def test_therapy_sensor_unique_id(mock_coordinator: MagicMock) -> None:
     """Test therapy sensor unique ID generation."""
-    sensor = BeurerTherapySensor(
-        mock_coordinator, "Test Lamp", THERAPY_SENSOR_DESCRIPTIONS[0]
-    )
+    sensor = BeurerSensor(mock_coordinator, "Test Lamp", THERAPY_SENSOR_DESCRIPTIONS[0])
 
     assert sensor.unique_id == "aa:bb:cc:dd:ee:ff_therapy_today"
 
 
 def test_therapy_sensor_device_info(mock_coordinator: MagicMock) -> None:
     """Test therapy sensor device info."""
-    sensor = BeurerTherapySensor(
+    sensor = BeurerSensor(
         mock_coordinator, "Test TL100", THERAPY_SENSOR_DESCRIPTIONS[0]
     )
     device_info = sensor.device_info
@@ -217,13 +290,49 @@ def test_therapy_sensor_device_info(mock_coordinator: MagicMock) -> None:
 
 def test_therapy_sensor_instance_reference(mock_coordinator: MagicMock) -> None:
     """Test therapy sensor correctly references instance from coordinator."""
-    sensor = BeurerTherapySensor(
-        mock_coordinator, "Test Lamp", THERAPY_SENSOR_DESCRIPTIONS[0]
-    )
+    sensor = BeurerSensor(mock_coordinator, "Test Lamp", THERAPY_SENSOR_DESCRIPTIONS[0])
 
     assert sensor._instance == mock_coordinator.instance
 
 
+# === Connection Health Sensor Tests ===
+
+
+def test_connection_health_sensor_values(mock_coordinator: MagicMock) -> None:
+    """Test connection health sensors read their metric via value_fn."""
+    mock_coordinator.instance.reconnect_count = 3
+    mock_coordinator.instance.command_success_rate = 95
+    mock_coordinator.instance.connection_uptime_seconds = 120
+
+    values = [
+        BeurerSensor(mock_coordinator, "Test Lamp", desc).native_value
+        for desc in CONNECTION_HEALTH_SENSOR_DESCRIPTIONS
+    ]
+
+    assert values == [3, 95, 120]
+
+
+def test_connection_health_sensor_attributes(mock_coordinator: MagicMock) -> None:
+    """Test only the success rate sensor exposes total_commands."""
+    mock_coordinator.instance.total_commands = 42
+    mock_coordinator.instance.available = False
+
+    reconnects, success_rate, _ = (
+        BeurerSensor(mock_coordinator, "Test Lamp", desc)
+        for desc in CONNECTION_HEALTH_SENSOR_DESCRIPTIONS
+    )
+
+    assert reconnects.extra_state_attributes is None
+    assert success_rate.extra_state_attributes == {"total_commands": 42}
+
+    mock_coordinator.instance.total_commands = 43
+    with patch.object(success_rate, "async_write_ha_state"):
+        success_rate._handle_coordinator_update()
+    assert success_rate.extra_state_attributes == {"total_commands": 43}
+    # Metrics are tracked from startup and stay available while disconnected
+    assert success_rate.available is True
+
+
 # === async_setup_entry Tests ===
 
 
@@ -235,6 +344,7 @@ class TestAsyncSetupEntry:
         """Create a mock BeurerInstance."""
         instance = MagicMock()
         instance.mac = "AA:BB:CC:DD:EE:FF"
+        instance.formatted_mac = "aa:bb:cc:dd:ee:ff"
         return instance
 
     @pytest.fixture
@@ -264,17 +374,13 @@ class TestAsyncSetupEntry:
 
         # Should create 8 entities: 2 diagnostic + 3 therapy + 3 connection health
         assert len(added_entities) == 8
-
-        # Verify types
-        diagnostic_sensors = [e for e in added_entities if isinstance(e, BeurerSensor)]
-        therapy_sensors = [
-            e for e in added_entities if isinstance(e, BeurerTherapySensor)
+        assert all(isinstance(e, BeurerSensor) for e in added_entities)
+        assert [e.entity_description for e in added_entities] == [
+            *SENSOR_DESCRIPTIONS,
+            *THERAPY_SENSOR_DESCRIPTIONS,
+            *CONNECTION_HEALTH_SENSOR_DESCRIPTIONS,
         ]
 
-        assert len(diagnostic_sensors) == 2
-        assert len(therapy_sensors) == 3
-        # 3 connection health sensors are the remaining entities
-
     @pytest.mark.asyncio
     async def test_uses_default_name(self, mock_coordinator: MagicMock) -> None:
         """Test that async_setup_entry uses default name when not provided."""
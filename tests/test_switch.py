@@ -52,8 +52,11 @@ class TestBeurerAdaptiveLightingSwitch:
         """Create a mock BeurerInstance."""
         instance = MagicMock()
         instance.mac = "AA:BB:CC:DD:EE:FF"
+        instance.formatted_mac = "aa:bb:cc:dd:ee:ff"
         instance.available = True
         instance.effect = "Off"
+        instance._therapy_active = False
+        instance.adaptive_lighting_switch = None
         instance.set_update_callback = MagicMock()
         instance.remove_update_callback = MagicMock()
         return instance
@@ -114,7 +117,7 @@ class TestBeurerAdaptiveLightingSwitch:
     def test_available(
         self, mock_coordinator: MagicMock, description: SwitchEntityDescription
     ) -> None:
-        """Test available property delegates to instance."""
+        """Test available follows the instance on coordinator updates."""
         switch = BeurerAdaptiveLightingSwitch(
             mock_coordinator, "Test Lamp", "entry_123", description
         )
@@ -122,6 +125,8 @@ class TestBeurerAdaptiveLightingSwitch:
         assert switch.available is True
 
         mock_coordinator.instance.available = False
+        with patch.object(switch, "async_write_ha_state"):
+            switch._handle_coordinator_update()
         assert switch.available is False
 
     def test_device_info(
@@ -180,21 +185,6 @@ class TestBeurerAdaptiveLightingSwitch:
         attrs = switch.extra_state_attributes
         assert attrs["therapy_mode_active"] is True
 
-    def test_extra_state_attributes_no_therapy_attr(
-        self, mock_coordinator: MagicMock, description: SwitchEntityDescription
-    ) -> None:
-        """Test extra_state_attributes when instance has no _therapy_active attr."""
-        mock_coordinator.instance.effect = "Off"
-        # Remove _therapy_active attribute
-        if hasattr(mock_coordinator.instance, "_therapy_active"):
-            delattr(mock_coordinator.instance, "_therapy_active")
-        switch = BeurerAdaptiveLightingSwitch(
-            mock_coordinator, "Test Lamp", "entry_123", description
-        )
-
-        attrs = switch.extra_state_attributes
-        assert attrs["therapy_mode_active"] is False
-
     @pytest.mark.asyncio
     async def test_async_added_to_hass_no_previous_state(
         self, mock_coordinator: MagicMock, description: SwitchEntityDescription
@@ -258,13 +248,13 @@ class TestBeurerAdaptiveLightingSwitch:
 
         await switch.async_will_remove_from_hass()
 
-        assert not hasattr(mock_coordinator.instance, "adaptive_lighting_switch")
+        assert mock_coordinator.instance.adaptive_lighting_switch is None
 
     @pytest.mark.asyncio
     async def test_async_will_remove_from_hass_no_attr(
         self, mock_coordinator: MagicMock, description: SwitchEntityDescription
     ) -> None:
-        """Test async_will_remove_from_hass when attribute doesn't exist."""
+        """Test async_will_remove_from_hass when no switch is registered."""
         switch = BeurerAdaptiveLightingSwitch(
             mock_coordinator, "Test Lamp", "entry_123", description
         )
@@ -273,6 +263,8 @@ class TestBeurerAdaptiveLightingSwitch:
         # Should not raise
         await switch.async_will_remove_from_hass()
 
+        assert mock_coordinator.instance.adaptive_lighting_switch is None
+
     @pytest.mark.asyncio
     async def test_async_turn_on(
         self, mock_coordinator: MagicMock, description: SwitchEntityDescription
@@ -305,6 +297,24 @@ class TestBeurerAdaptiveLightingSwitch:
         assert switch._is_on is False
         mock_write.assert_called_once()
 
+    def test_coordinator_update_skips_unchanged_state(
+        self, mock_coordinator: MagicMock, description: SwitchEntityDescription
+    ) -> None:
+        """Test repeated coordinator updates without changes write once."""
+        switch = BeurerAdaptiveLightingSwitch(
+            mock_coordinator, "Test Lamp", "entry_123", description
+        )
+
+        with patch.object(switch, "async_write_ha_state") as mock_write:
+            switch._handle_coordinator_update()
+            switch._handle_coordinator_update()
+            assert mock_write.call_count == 0
+
+            mock_coordinator.instance.effect = "Rainbow"
+            switch._handle_coordinator_update()
+            assert mock_write.call_count == 1
+            assert switch.extra_state_attributes["current_effect"] == "Rainbow"
+
 
 # =============================================================================
 # Test should_block_adaptive_lighting
@@ -319,8 +329,11 @@ class TestShouldBlockAdaptiveLighting:
         """Create a mock BeurerInstance."""
         instance = MagicMock()
         instance.mac = "AA:BB:CC:DD:EE:FF"
+        instance.formatted_mac = "aa:bb:cc:dd:ee:ff"
         instance.available = True
         instance.effect = "Off"
+        instance._therapy_active = False
+        instance.adaptive_lighting_switch = None
         instance.set_update_callback = MagicMock()
         instance.remove_update_callback = MagicMock()
         return instance
@@ -385,13 +398,11 @@ class TestShouldBlockAdaptiveLighting:
 
         assert switch.should_block_adaptive_lighting() is False
 
-    def test_no_block_when_no_therapy_attr(
+    def test_no_block_by_default(
         self, mock_coordinator: MagicMock, description: SwitchEntityDescription
     ) -> None:
-        """Test doesn't block when no therapy attribute exists."""
+        """Test doesn't block with the instance's default therapy state."""
         mock_coordinator.instance.effect = "Off"
-        if hasattr(mock_coordinator.instance, "_therapy_active"):
-            delattr(mock_coordinator.instance, "_therapy_active")
         switch = BeurerAdaptiveLightingSwitch(
             mock_coordinator, "Test Lamp", "entry_123", description
         )
@@ -426,6 +437,7 @@ class TestAsyncSetupEntry:
         """Create a mock BeurerInstance."""
         instance = MagicMock()
         instance.mac = "AA:BB:CC:DD:EE:FF"
+        instance.formatted_mac = "aa:bb:cc:dd:ee:ff"
         return instance
 
     @pytest.fixture
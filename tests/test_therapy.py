@@ -1,9 +1,12 @@
 """Test Beurer Daylight Lamps therapy module."""
 
+from collections.abc import Coroutine
 from datetime import UTC, datetime, timedelta
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from freezegun.api import FrozenDateTimeFactory
 
 from custom_components.beurer_daylight_lamps.therapy import (
     SUNRISE_PROFILES,
@@ -15,6 +18,55 @@ from custom_components.beurer_daylight_lamps.therapy import (
 )
 
 
+def _record_session(
+    tracker: TherapyTracker,
+    freezer: FrozenDateTimeFactory,
+    start: str,
+    minutes: float,
+) -> None:
+    """Record a completed therapy session through the tracker.
+
+    Only end_session adds to the history, so tests replay sessions in start
+    order on a frozen clock instead of appending to tracker.sessions.
+    """
+    freezer.move_to(start)
+    tracker.start_session()
+    freezer.tick(timedelta(minutes=minutes))
+    tracker.end_session()
+
+
+async def _run_with_fake_clock(
+    sim: SunriseSimulation,
+    instance: MagicMock,
+    simulation: Coroutine[Any, Any, None],
+    write_seconds: list[float],
+) -> list[float]:
+    """Run a simulation on a fake scheduling clock and return its sleep delays.
+
+    Each lamp write advances the clock by the next entry of write_seconds
+    and each step wait jumps to its deadline, so deadlines are checked
+    without waiting. Only the simulation's own clock is replaced.
+    """
+    clock = [0.0]
+    writes = iter(write_seconds)
+    sleeps: list[float] = []
+
+    async def write(*_args: object) -> None:
+        clock[0] += next(writes)
+
+    async def sleep_until(deadline: float) -> None:
+        sleeps.append(deadline - clock[0])
+        clock[0] = deadline
+
+    instance.set_color_with_brightness_fast = AsyncMock(side_effect=write)
+    with (
+        patch.object(sim, "_clock", side_effect=lambda: clock[0]),
+        patch.object(sim, "_sleep_until", side_effect=sleep_until),
+    ):
+        await simulation
+    return sleeps
+
+
 class TestTherapySession:
     """Tests for TherapySession dataclass."""
 
@@ -35,6 +87,13 @@ class TestTherapySession:
         )
         assert 29.9 < session.duration_minutes < 30.1
 
+    def test_duration_minutes_at(self) -> None:
+        """Test open sessions are measured up to the given time."""
+        start = datetime(2026, 1, 8, 12, 0, tzinfo=UTC)
+        session = TherapySession(start_time=start)
+
+        assert session.duration_minutes_at(start + timedelta(minutes=12)) == 12
+
     def test_is_therapy_light_true(self) -> None:
         """Test therapy light detection for qualifying session."""
         session = TherapySession(
@@ -133,147 +192,150 @@ class TestTherapyTracker:
         assert session is not None
         assert len(tracker.sessions) == 0  # Not added due to non-therapy light
 
-    def test_today_minutes(self) -> None:
-        """Test today's therapy minutes calculation."""
+    def test_end_session_decides_qualification_at_end(
+        self, freezer: FrozenDateTimeFactory
+    ) -> None:
+        """Test a session warmed up before it ends never enters the totals."""
+        freezer.move_to("2026-01-08 11:40:00")
         tracker = TherapyTracker()
+        tracker.start_session(color_temp_kelvin=5300, brightness_pct=100)
+        freezer.tick(timedelta(minutes=10))
+        tracker.update_session(color_temp_kelvin=3000)
+        tracker.end_session()
 
-        # Add a session from today
-        session = TherapySession(
-            start_time=datetime.now(tz=UTC) - timedelta(minutes=20),
-            end_time=datetime.now(tz=UTC) - timedelta(minutes=10),
-            color_temp_kelvin=5300,
-            brightness_pct=100,
-        )
-        tracker.sessions.append(session)
+        assert len(tracker.sessions) == 0
+        assert tracker.today_minutes == 0
+
+    def test_today_minutes(self, freezer: FrozenDateTimeFactory) -> None:
+        """Test today's therapy minutes calculation."""
+        tracker = TherapyTracker()
+        _record_session(tracker, freezer, "2026-01-08 11:40:00", minutes=10)
 
-        # Should report ~10 minutes
-        assert 9.5 < tracker.today_minutes < 10.5
+        assert tracker.today_minutes == 10
 
-    def test_today_minutes_excludes_yesterday(self) -> None:
+    def test_today_minutes_excludes_yesterday(
+        self, freezer: FrozenDateTimeFactory
+    ) -> None:
         """Test that yesterday's sessions are excluded."""
         tracker = TherapyTracker()
+        _record_session(tracker, freezer, "2026-01-07 11:40:00", minutes=10)
+        freezer.move_to("2026-01-08 12:00:00")
 
-        # Add a session from yesterday
-        yesterday = datetime.now(tz=UTC) - timedelta(days=1)
-        session = TherapySession(
-            start_time=yesterday - timedelta(minutes=20),
-            end_time=yesterday - timedelta(minutes=10),
-            color_temp_kelvin=5300,
-            brightness_pct=100,
-        )
-        tracker.sessions.append(session)
+        assert tracker.today_minutes == 0
 
+    def test_today_minutes_tracks_new_sessions(
+        self, freezer: FrozenDateTimeFactory
+    ) -> None:
+        """Test cached totals pick up sessions added to the history."""
+        freezer.move_to("2026-01-08 11:40:00")
+        tracker = TherapyTracker()
         assert tracker.today_minutes == 0
 
-    def test_week_minutes(self, freezer) -> None:
-        """Test weekly therapy minutes calculation."""
-        # Freeze time to Thursday so all 3 sessions (today, yesterday, 2 days ago)
-        # fall within the same week (Mon-Sun)
-        freezer.move_to("2026-01-08 12:00:00")  # Thursday
+        _record_session(tracker, freezer, "2026-01-08 11:40:00", minutes=10)
+
+        assert tracker.today_minutes == 10
 
+    def test_week_minutes(self, freezer: FrozenDateTimeFactory) -> None:
+        """Test weekly therapy minutes calculation."""
         tracker = TherapyTracker()
+        # Tuesday to Thursday of the same week (Mon-Sun)
+        for day in (6, 7, 8):
+            _record_session(tracker, freezer, f"2026-01-0{day} 11:40:00", minutes=10)
 
-        # Add sessions from this week
-        for i in range(3):
-            session = TherapySession(
-                start_time=datetime.now(tz=UTC) - timedelta(days=i, minutes=20),
-                end_time=datetime.now(tz=UTC) - timedelta(days=i, minutes=10),
-                color_temp_kelvin=5300,
-                brightness_pct=100,
-            )
-            tracker.sessions.append(session)
+        assert tracker.week_minutes == 30
 
-        # Should report ~30 minutes (3 x 10)
-        assert 29 < tracker.week_minutes < 31
+    def test_week_minutes_stops_at_previous_week(
+        self, freezer: FrozenDateTimeFactory
+    ) -> None:
+        """Test sessions from before the week are not counted."""
+        tracker = TherapyTracker()
+        # Sunday of the previous week, then Monday and Thursday of this week
+        for start in ("2026-01-04 20:00:00", "2026-01-05 08:00:00"):
+            _record_session(tracker, freezer, start, minutes=15)
+        _record_session(tracker, freezer, "2026-01-08 11:40:00", minutes=10)
 
-    def test_goal_reached(self) -> None:
+        assert tracker.week_minutes == 25
+        assert tracker.today_minutes == 10
+
+    def test_goal_reached(self, freezer: FrozenDateTimeFactory) -> None:
         """Test goal reached detection."""
         tracker = TherapyTracker(daily_goal_minutes=15)
-
-        # Add session that meets goal
-        session = TherapySession(
-            start_time=datetime.now(tz=UTC) - timedelta(minutes=20),
-            end_time=datetime.now(tz=UTC) - timedelta(minutes=4),
-            color_temp_kelvin=5300,
-            brightness_pct=100,
-        )
-        tracker.sessions.append(session)
+        _record_session(tracker, freezer, "2026-01-08 11:40:00", minutes=16)
 
         assert tracker.goal_reached is True
 
-    def test_goal_not_reached(self) -> None:
+    def test_goal_not_reached(self, freezer: FrozenDateTimeFactory) -> None:
         """Test goal not reached detection."""
         tracker = TherapyTracker(daily_goal_minutes=30)
-
-        # Add session that doesn't meet goal
-        session = TherapySession(
-            start_time=datetime.now(tz=UTC) - timedelta(minutes=20),
-            end_time=datetime.now(tz=UTC) - timedelta(minutes=10),
-            color_temp_kelvin=5300,
-            brightness_pct=100,
-        )
-        tracker.sessions.append(session)
+        _record_session(tracker, freezer, "2026-01-08 11:40:00", minutes=10)
 
         assert tracker.goal_reached is False
 
-    def test_goal_progress_pct(self) -> None:
+    def test_goal_progress_pct(self, freezer: FrozenDateTimeFactory) -> None:
         """Test goal progress percentage calculation."""
         tracker = TherapyTracker(daily_goal_minutes=20)
+        # 10-minute session (50% of goal)
+        _record_session(tracker, freezer, "2026-01-08 11:40:00", minutes=10)
 
-        # Add 10-minute session (50% of goal)
-        session = TherapySession(
-            start_time=datetime.now(tz=UTC) - timedelta(minutes=20),
-            end_time=datetime.now(tz=UTC) - timedelta(minutes=10),
-            color_temp_kelvin=5300,
-            brightness_pct=100,
-        )
-        tracker.sessions.append(session)
-
-        assert 45 < tracker.goal_progress_pct < 55
+        assert tracker.goal_progress_pct == 50
 
-    def test_goal_progress_pct_capped(self) -> None:
+    def test_goal_progress_pct_capped(self, freezer: FrozenDateTimeFactory) -> None:
         """Test goal progress percentage is capped at 100."""
         tracker = TherapyTracker(daily_goal_minutes=10)
-
-        # Add 20-minute session (200% of goal)
-        # Use noon today to avoid midnight boundary issues in CI
-        now = datetime.now(tz=UTC).replace(hour=12, minute=0, second=0, microsecond=0)
-        session = TherapySession(
-            start_time=now - timedelta(minutes=30),
-            end_time=now - timedelta(minutes=10),
-            color_temp_kelvin=5300,
-            brightness_pct=100,
-        )
-        tracker.sessions.append(session)
+        # 20-minute session (200% of goal)
+        _record_session(tracker, freezer, "2026-01-08 11:30:00", minutes=20)
 
         assert tracker.goal_progress_pct == 100
 
-    def test_cleanup_old_sessions(self) -> None:
+    def test_cleanup_old_sessions(self, freezer: FrozenDateTimeFactory) -> None:
         """Test cleanup of old sessions."""
         tracker = TherapyTracker()
+        _record_session(tracker, freezer, "2026-01-01 12:00:00", minutes=10)
+        _record_session(tracker, freezer, "2026-01-10 12:00:00", minutes=10)
+        freezer.move_to("2026-01-11 12:00:00")
 
-        # Add old session
-        old_session = TherapySession(
-            start_time=datetime.now(tz=UTC) - timedelta(days=10),
-            end_time=datetime.now(tz=UTC) - timedelta(days=10) + timedelta(minutes=10),
-            color_temp_kelvin=5300,
-            brightness_pct=100,
-        )
-        tracker.sessions.append(old_session)
+        tracker.cleanup_old_sessions()
 
-        # Add recent session
-        recent_session = TherapySession(
-            start_time=datetime.now(tz=UTC) - timedelta(days=1),
-            end_time=datetime.now(tz=UTC) - timedelta(days=1) + timedelta(minutes=10),
-            color_temp_kelvin=5300,
-            brightness_pct=100,
-        )
-        tracker.sessions.append(recent_session)
+        assert len(tracker.sessions) == 1
+        assert tracker.sessions[0].start_time == datetime(2026, 1, 10, 12, tzinfo=UTC)
+
+    def test_sessions_ordered_and_trimmed_from_left(
+        self, freezer: FrozenDateTimeFactory
+    ) -> None:
+        """Test ended sessions stay in start order and cleanup trims the head."""
+        freezer.move_to("2026-01-01 08:00:00")
+        tracker = TherapyTracker()
+        for _ in range(4):
+            tracker.start_session()
+            freezer.tick(timedelta(minutes=10))
+            tracker.end_session()
+            freezer.tick(timedelta(days=3))
+
+        starts = [session.start_time for session in tracker.sessions]
+        assert len(starts) == 4
+        assert starts == sorted(starts)
+
+        tracker.cleanup_old_sessions()
+
+        # Now day 13: sessions from days 1 and 4 expire, days 7 and 10 remain
+        assert [session.start_time for session in tracker.sessions] == starts[2:]
+
+    def test_today_minutes_refreshes_after_cleanup_and_new_session(
+        self, freezer: FrozenDateTimeFactory
+    ) -> None:
+        """Test cached totals refresh when cleanup and a new session keep the size."""
+        tracker = TherapyTracker()
+        _record_session(tracker, freezer, "2025-12-29 12:00:00", minutes=10)
+        freezer.move_to("2026-01-08 12:00:00")
+        assert tracker.today_minutes == 0
 
         tracker.cleanup_old_sessions()
+        tracker.start_session()
+        freezer.tick(timedelta(minutes=10))
+        tracker.end_session()
 
         assert len(tracker.sessions) == 1
-        assert tracker.sessions[0] == recent_session
+        assert tracker.today_minutes == 10
 
 
 class TestSunriseProfiles:
@@ -420,6 +482,49 @@ class TestSunriseSimulationExecution:
         # Should have called set_color_with_brightness_fast at least once
         assert mock_instance.set_color_with_brightness_fast.call_count >= 1
 
+    @pytest.mark.asyncio
+    async def test_run_sunrise_sleeps_until_step_deadline(
+        self, mock_instance: MagicMock
+    ) -> None:
+        """Test _run_sunrise subtracts step execution time from the wait."""
+        sim = SunriseSimulation(mock_instance)
+        sim._running = True
+        config = SUNRISE_PROFILES[SunriseProfile.NATURAL]
+        # Two 60s steps; the writes take 30s and 40s
+        sleeps = await _run_with_fake_clock(
+            sim,
+            mock_instance,
+            sim._run_sunrise(duration_minutes=2, config=config),
+            write_seconds=[30.0, 40.0, 0.0],
+        )
+
+        assert sleeps == [30.0, 20.0]
+        assert mock_instance.set_color_with_brightness_fast.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_run_sunrise_skips_overdue_steps(
+        self, mock_instance: MagicMock
+    ) -> None:
+        """Test _run_sunrise jumps to the current step after a stall."""
+        sim = SunriseSimulation(mock_instance)
+        sim._running = True
+        config = SUNRISE_PROFILES[SunriseProfile.NATURAL]
+        # The first write stalls past the deadlines of steps 1 and 2
+        sleeps = await _run_with_fake_clock(
+            sim,
+            mock_instance,
+            sim._run_sunrise(duration_minutes=3, config=config),
+            write_seconds=[150.0, 0.0, 0.0],
+        )
+
+        assert sleeps == [30.0]
+        brightness = [
+            c.args[1]
+            for c in mock_instance.set_color_with_brightness_fast.call_args_list
+        ]
+        assert len(brightness) == 3
+        assert brightness[-1] == int(config.end_brightness_pct / 100 * 255)
+
     @pytest.mark.asyncio
     async def test_run_sunrise_stops_when_not_running(
         self, mock_instance: MagicMock
@@ -628,53 +733,35 @@ class TestTherapyTrackerCurrentSession:
 
         assert tracker.today_minutes == 0
 
-    def test_week_minutes_includes_current_session(self) -> None:
+    def test_week_minutes_includes_current_session(
+        self, freezer: FrozenDateTimeFactory
+    ) -> None:
         """Test week_minutes includes active current session."""
         tracker = TherapyTracker()
-
-        # Add historical session
-        tracker.sessions.append(
-            TherapySession(
-                start_time=datetime.now(tz=UTC) - timedelta(days=1, minutes=30),
-                end_time=datetime.now(tz=UTC) - timedelta(days=1, minutes=20),
-                color_temp_kelvin=5300,
-                brightness_pct=100,
-            )
-        )
+        _record_session(tracker, freezer, "2026-01-07 11:30:00", minutes=10)
 
         # Start a current session
-        tracker._current_session = TherapySession(
-            start_time=datetime.now(tz=UTC) - timedelta(minutes=15),
-            color_temp_kelvin=5300,
-            brightness_pct=100,
-        )
+        freezer.move_to("2026-01-08 11:45:00")
+        tracker.start_session(color_temp_kelvin=5300, brightness_pct=100)
+        freezer.tick(timedelta(minutes=15))
 
-        # Should be about 25 minutes (10 historical + 15 current)
-        assert 24 < tracker.week_minutes < 26
+        # 10 historical + 15 current
+        assert tracker.week_minutes == 25
 
-    def test_week_minutes_excludes_non_therapy_current_session(self) -> None:
+    def test_week_minutes_excludes_non_therapy_current_session(
+        self, freezer: FrozenDateTimeFactory
+    ) -> None:
         """Test week_minutes excludes non-therapy current session."""
         tracker = TherapyTracker()
-
-        # Add historical session
-        tracker.sessions.append(
-            TherapySession(
-                start_time=datetime.now(tz=UTC) - timedelta(days=1, minutes=30),
-                end_time=datetime.now(tz=UTC) - timedelta(days=1, minutes=20),
-                color_temp_kelvin=5300,
-                brightness_pct=100,
-            )
-        )
+        _record_session(tracker, freezer, "2026-01-07 11:30:00", minutes=10)
 
         # Start a non-therapy current session
-        tracker._current_session = TherapySession(
-            start_time=datetime.now(tz=UTC) - timedelta(minutes=15),
-            color_temp_kelvin=3000,
-            brightness_pct=50,
-        )
+        freezer.move_to("2026-01-08 11:45:00")
+        tracker.start_session(color_temp_kelvin=3000, brightness_pct=50)
+        freezer.tick(timedelta(minutes=15))
 
-        # Should only be 10 minutes (historical only)
-        assert 9 < tracker.week_minutes < 11
+        # Historical only
+        assert tracker.week_minutes == 10
 
     def test_end_session_returns_none_when_no_session(self) -> None:
         """Test end_session returns None when no active session."""